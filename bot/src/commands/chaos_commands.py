@@ -12,7 +12,9 @@ if TYPE_CHECKING:
     from src.main import VectoBeat
 
 from src.services.chaos_service import ChaosService
-from src.utils.embeds import EmbedFactory
+from src.utils.discord_cache import display_name_for, interaction_member
+from src.utils.embeds import add_fields, get_embed_factory
+from src.utils.perm_cache import permission_cache
 
 
 def _service(bot: "VectoBeat") -> ChaosService:
@@ -34,30 +36,33 @@ class ChaosCommands(commands.Cog):
     def _ensure_manage_guild(inter: discord.Interaction) -> Optional[str]:
         if not inter.guild:
             return "Guild-only command."
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
-        if not isinstance(member, discord.Member):
-            return "Unable to resolve member."
-        if not member.guild_permissions.manage_guild:
+        allowed = permission_cache.get("manage_guild", inter.guild.id, inter.user.id)
+        if allowed is None:
+            member = interaction_member(inter)
+            if not isinstance(member, discord.Member):
+                return "Unable to resolve member."
+            allowed = member.guild_permissions.manage_guild
+            permission_cache.set("manage_guild", inter.guild.id, inter.user.id, None, allowed)
+        if not allowed:
             return "You need the `Manage Server` permission."
         return None
 
     @chaos.command(name="status", description="Show recent chaos drills and schedule info.")
     async def status(self, inter: discord.Interaction) -> None:
         service = _service(self.bot)
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
         embed = factory.primary("Chaos Playbook")
-        embed.add_field(name="Enabled", value="✅" if service.enabled else "❌", inline=True)
-        embed.add_field(name="Interval", value=f"`{service.config.interval_minutes} min`", inline=True)
-        embed.add_field(name="Scenarios", value=", ".join(service.config.scenarios), inline=False)
-        history = service.recent_history()
-        if history:
-            lines = []
-            for scenario, success, details in reversed(history[-5:]):
-                icon = "✅" if success else "❌"
-                lines.append(f"{icon} `{scenario}` — {details}")
-            embed.add_field(name="Recent Drills", value="\n".join(lines), inline=False)
-        else:
-            embed.add_field(name="Recent Drills", value="_None yet_", inline=False)
+        recent = "\n".join(
+            f"{'✅' if success else '❌'} `{scenario}` — {details}"
+            for scenario, success, details in service.recent_history(limit=5)
+        )
+        add_fields(
+            embed,
+            ("Enabled", "✅" if service.enabled else "❌", True),
+            ("Interval", f"`{service.config.interval_minutes} min`", True),
+            ("Scenarios", ", ".join(service.config.scenarios), False),
+            ("Recent Drills", recent or "_None yet_", False),
+        )
         await inter.response.send_message(embed=embed, ephemeral=True)
 
     @chaos.command(name="run", description="Trigger a chaos scenario immediately.")
@@ -69,11 +74,11 @@ class ChaosCommands(commands.Cog):
         service = _service(self.bot)
         await inter.response.defer(ephemeral=True)
         if scenario:
-            result = await service.run_scenario(scenario, triggered_by=inter.user.display_name)
+            result = await service.run_scenario(scenario, triggered_by=display_name_for(inter.user))
         else:
-            result = await service.run_random(inter.user.display_name)
+            result = await service.run_random(display_name_for(inter.user))
         name, success, details = result
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
         embed = (factory.success if success else factory.error)(
             f"Chaos: {name}", details
         )
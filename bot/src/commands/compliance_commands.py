@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, cast, Dict, Any, Optional
-import io
-from datetime import datetime, timezone
+import asyncio
+import gzip
+import hmac
+import tempfile
 
 import discord
 from discord import app_commands
@@ -13,12 +15,16 @@ from typing import TYPE_CHECKING, cast
 if TYPE_CHECKING:
     from src.main import VectoBeat
 
-from src.utils.embeds import EmbedFactory
+from src.utils.embeds import add_fields, get_embed_factory
+from src.utils.perm_cache import permission_cache
 from src.utils.security import SensitiveScope, has_scope, log_sensitive_action
+from src.utils.time import utc_file_timestamp
 
 if TYPE_CHECKING:
     from src.services.analytics_export_service import AnalyticsExportService
 
+_PAID_TIERS = frozenset({"growth", "scale", "enterprise"})
+
 
 def _service(bot: "VectoBeat") -> AnalyticsExportService:
     svc = getattr(bot, "analytics_export", None)
@@ -41,8 +47,12 @@ class ComplianceCommands(commands.Cog):
             return True
         if not inter.guild or not user:
             return False
-        member = inter.guild.get_member(user.id)
-        return bool(member and member.guild_permissions.administrator)
+        allowed = permission_cache.get("administrator", inter.guild.id, user.id)
+        if allowed is None:
+            member = inter.guild.get_member(user.id)
+            allowed = bool(member and member.guild_permissions.administrator)
+            permission_cache.set("administrator", inter.guild.id, user.id, None, allowed)
+        return allowed
 
     def _log(self, inter: discord.Interaction, action: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         log_sensitive_action(
@@ -68,24 +78,35 @@ class ComplianceCommands(commands.Cog):
             await inter.response.send_message("Compliance exports are not configured.", ephemeral=True)
             return
         await inter.response.defer(ephemeral=True)
-        payload = await service.export_snapshot(inter.guild.id, include_historic=include_historic)
-        if payload is None:
+        if not await service.can_export(inter.guild.id):
             await inter.followup.send(
                 "Compliance exports are limited to Growth plans and above.",
                 ephemeral=True,
             )
             return
-        if not payload:
+        # Spool records to memory (rolling over to disk past 1 MiB) instead of holding the whole export,
+        # compressing as we go so the upload is a fraction of the raw JSONL.
+        buffer = tempfile.SpooledTemporaryFile(max_size=1 << 20, mode="w+b")
+        written = 0
+        with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=1) as sink:
+            async for chunk in service.stream_snapshot(inter.guild.id, include_historic=include_historic):
+                await asyncio.to_thread(sink.write, chunk)
+                written += len(chunk)
+        if not written:
+            buffer.close()
             await inter.followup.send("No compliance events found for this guild.", ephemeral=True)
             self._log(inter, action="export_empty")
             return
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-        filename = f"compliance-{inter.guild.id}-{timestamp}.jsonl"
-        buffer = io.BytesIO(payload.encode("utf-8"))
+        compressed = buffer.tell()
+        buffer.seek(0)
+        timestamp = utc_file_timestamp()
+        filename = f"compliance-{inter.guild.id}-{timestamp}.jsonl.gz"
         file = discord.File(buffer, filename=filename)
-        embed = EmbedFactory(inter.guild.id).success("Compliance export ready", "Attached JSONL contains the latest events.")
+        embed = get_embed_factory(inter.guild.id).success(
+            "Compliance export ready", "Attached gzip-compressed JSONL contains the latest events."
+        )
         await inter.followup.send(embed=embed, file=file, ephemeral=True)
-        self._log(inter, action="export", metadata={"bytes": len(payload)})
+        self._log(inter, action="export", metadata={"bytes": written, "compressed_bytes": compressed})
 
     @compliance.command(name="delete", description="Permanently delete all compliance data for this guild (GDPR).")
     @app_commands.describe(confirm="Type 'CONFIRM' to execute deletion.")
@@ -96,15 +117,17 @@ class ComplianceCommands(commands.Cog):
         if not inter.guild:
             await inter.response.send_message("This command must be used in a guild.", ephemeral=True)
             return
-        if confirm != "CONFIRM":
+        if not hmac.compare_digest(confirm.encode("utf-8"), b"CONFIRM"):
             await inter.response.send_message("You must type 'CONFIRM' to execute deletion.", ephemeral=True)
             return
 
         service = _service(self.bot)
+        # Acknowledge first so large purges cannot exceed the interaction deadline.
+        await inter.response.defer(ephemeral=True)
         await service.delete_data(inter.guild.id)
 
-        embed = EmbedFactory(inter.guild.id).success("Compliance Data Deleted", "All logs and exports have been purged.")
-        await inter.response.send_message(embed=embed, ephemeral=True)
+        embed = get_embed_factory(inter.guild.id).success("Compliance Data Deleted", "All logs and exports have been purged.")
+        await inter.followup.send(embed=embed, ephemeral=True)
         self._log(inter, action="delete_data")
 
     @compliance.command(name="status", description="Check compliance mode and data retention status.")
@@ -120,14 +143,17 @@ class ComplianceCommands(commands.Cog):
 
         # Check Tier
         settings = getattr(self.bot, "server_settings", None)
-        tier = await settings.tier(inter.guild.id) if settings else "free"
-        can_export = tier in {"growth", "scale", "enterprise"}
+        tier = await settings.tier_cached(inter.guild.id) if settings else "free"
+        can_export = tier in _PAID_TIERS
 
-        factory = EmbedFactory(inter.guild.id)
+        factory = get_embed_factory(inter.guild.id)
         embed = factory.primary("Compliance Status")
-        embed.add_field(name="Compliance Mode", value="✅ Enabled" if compliance_mode else "❌ Disabled", inline=True)
-        embed.add_field(name="Export Capability", value="✅ Active" if can_export else "❌ Requires Growth Plan", inline=True)
-        embed.add_field(name="Plan Tier", value=tier.title(), inline=True)
+        add_fields(
+            embed,
+            ("Compliance Mode", "✅ Enabled" if compliance_mode else "❌ Disabled", True),
+            ("Export Capability", "✅ Active" if can_export else "❌ Requires Growth Plan", True),
+            ("Plan Tier", tier.title(), True),
+        )
 
         await inter.response.send_message(embed=embed, ephemeral=True)
 
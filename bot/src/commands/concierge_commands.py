@@ -9,10 +9,12 @@ from discord import app_commands
 from discord.ext import commands
 
 from src.services.concierge_service import ConciergeService
-from src.utils.embeds import EmbedFactory
+from src.utils.discord_cache import user_label
+from src.utils.embeds import add_fields, get_embed_factory
+from src.utils.perm_cache import permission_cache
 from src.utils.security import SensitiveScope, has_scope, log_sensitive_action
 
-GROWTH_PLUS = {"growth", "scale", "enterprise"}
+GROWTH_PLUS = frozenset({"growth", "scale", "enterprise"})
 
 
 def _service(bot: commands.Bot) -> ConciergeService:
@@ -35,7 +37,7 @@ class ConciergeCommands(commands.Cog):
         if not settings or not inter.guild:
             return True
         try:
-            tier = await settings.tier(inter.guild.id)
+            tier = await settings.tier_cached(inter.guild.id)
         except Exception:
             tier = "free"
         if tier.lower() not in GROWTH_PLUS:
@@ -52,8 +54,12 @@ class ConciergeCommands(commands.Cog):
             return True
         if not inter.guild or not user:
             return False
-        member = inter.guild.get_member(user.id)
-        return bool(member and member.guild_permissions.manage_guild)
+        allowed = permission_cache.get("manage_guild", inter.guild.id, user.id)
+        if allowed is None:
+            member = inter.guild.get_member(user.id)
+            allowed = bool(member and member.guild_permissions.manage_guild)
+            permission_cache.set("manage_guild", inter.guild.id, user.id, None, allowed)
+        return allowed
 
     def _log(self, inter: discord.Interaction, action: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         log_sensitive_action(
@@ -72,12 +78,13 @@ class ConciergeCommands(commands.Cog):
         hours="Number of hours you expect to need (integer).",
     )
     async def request(self, inter: discord.Interaction, contact: str, summary: str, hours: app_commands.Range[int, 1, 24]) -> None:
-        if not await self._ensure_growth_plan(inter):
-            return
+        # Synchronous enabled check first so disabled deployments skip the tier lookup.
         service = _service(self.bot)
         if not getattr(service, "enabled", False):
             await inter.response.send_message("Concierge integration is temporarily unavailable.", ephemeral=True)
             return
+        if not await self._ensure_growth_plan(inter):
+            return
         await inter.response.defer(ephemeral=True)
         result = await service.create_request(
             inter.guild.id if inter.guild else 0,
@@ -85,10 +92,10 @@ class ConciergeCommands(commands.Cog):
             summary=summary,
             hours=int(hours),
             actor_id=inter.user.id if inter.user else None,
-            actor_name=str(inter.user),
+            actor_name=user_label(inter.user),
             guild_name=inter.guild.name if inter.guild else None,
         )
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
         if not result:
             await inter.followup.send("Unable to submit your concierge request right now.", ephemeral=True)
             return
@@ -98,10 +105,9 @@ class ConciergeCommands(commands.Cog):
             "Your request was logged. Our concierge desk will respond within the SLA.",
         )
         request_id = result.get("requestId")
-        embed.add_field(name="Contact", value=contact or "n/a", inline=True)
-        embed.add_field(name="Hours requested", value=str(hours), inline=True)
+        add_fields(embed, ("Contact", contact or "n/a", True), ("Hours requested", hours, True))
         if request_id:
-          embed.add_field(name="Request ID", value=f"`{request_id}`", inline=False)
+            embed.add_field(name="Request ID", value=f"`{request_id}`", inline=False)
         if usage:
             remaining = usage.get("remaining")
             if remaining is not None:
@@ -111,15 +117,15 @@ class ConciergeCommands(commands.Cog):
 
     @concierge.command(name="usage", description="Show remaining concierge hours this cycle.")
     async def usage(self, inter: discord.Interaction) -> None:
-        if not await self._ensure_growth_plan(inter):
-            return
         service = _service(self.bot)
         if not getattr(service, "enabled", False):
             await inter.response.send_message("Concierge integration is temporarily unavailable.", ephemeral=True)
             return
+        if not await self._ensure_growth_plan(inter):
+            return
         await inter.response.defer(ephemeral=True)
         usage = await service.fetch_usage(inter.guild.id if inter.guild else 0)
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
         if not usage:
             embed = factory.warning("No concierge usage found.", "Requests will appear here once logged.")
             await inter.followup.send(embed=embed, ephemeral=True)
@@ -128,8 +134,11 @@ class ConciergeCommands(commands.Cog):
         remaining = usage.get("remaining")
         total = usage.get("total")
         embed = factory.primary("Concierge usage")
-        embed.add_field(name="Used hours", value=str(usage.get("used") or 0), inline=True)
-        embed.add_field(name="Remaining", value=str(remaining if remaining is not None else "∞"), inline=True)
+        add_fields(
+            embed,
+            ("Used hours", usage.get("used") or 0, True),
+            ("Remaining", remaining if remaining is not None else "∞", True),
+        )
         if total is not None:
             embed.add_field(name="Monthly quota", value=str(total), inline=True)
         await inter.followup.send(embed=embed, ephemeral=True)
@@ -153,10 +162,10 @@ class ConciergeCommands(commands.Cog):
             inter.guild.id if inter.guild else 0,
             request_id,
             actor_id=inter.user.id if inter.user else 0,
-            actor_name=str(inter.user),
+            actor_name=user_label(inter.user),
             note=note,
         )
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
         if not result:
             await inter.followup.send("Unable to resolve that concierge request.", ephemeral=True)
             return
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import discord
 import lavalink
@@ -15,44 +16,135 @@ if TYPE_CHECKING:
     from src.main import VectoBeat
 from lavalink.errors import ClientError
 
-from src.services.lavalink_service import LavalinkVoiceClient
-from src.utils.embeds import EmbedFactory
+from src.services.lavalink_service import LavalinkVoiceClient, VectoPlayer
+from src.utils.discord_cache import interaction_member
+from src.utils.embeds import EmbedFactory, add_fields, get_embed_factory
+from src.utils.perm_cache import permission_cache
 
 REQUIRED_VOICE_PERMS = ("connect", "speak", "view_channel", "use_voice_activation")
+# (attr, label, bit) resolved once at import; summaries test bits against ``Permissions.value``.
+_PERM_TABLE = tuple(
+    (attr, attr.replace("_", " ").title(), getattr(discord.Permissions, attr).flag) for attr in REQUIRED_VOICE_PERMS
+)
 GUILD_ONLY_MSG = "This command can only be used within a guild."
 
 
+# channel_id -> (name, bitrate, user_limit, rendered); one entry per channel, replaced on edits.
+_CHANNEL_INFO_CACHE: dict[int, tuple[str, int, int, str]] = {}
+CHANNEL_INFO_MAX_ENTRIES = 4096
+
+
 class ConnectionCommands(commands.Cog):
     """Enterprise-ready voice connection controls for VectoBeat."""
 
     def __init__(self, bot: commands.Bot):
         self.bot: VectoBeat = cast(Any, bot) # type: ignore
-        self._connect_lock = asyncio.Lock()
+        # guild_id -> (lock, number of /connect calls holding or waiting on it)
+        self._connect_locks: dict[int, tuple[asyncio.Lock, int]] = {}
+        self._bot_members: dict[int, discord.Member] = {}
+        # (guild_id, missing labels) -> (factory that built it, embed); rebuilt when the factory changes.
+        self._missing_embeds: dict[tuple[int, frozenset[str]], tuple[EmbedFactory, discord.Embed]] = {}
+
+    # ------------------------------------------------------------------ listeners
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        for guild in self.bot.guilds:
+            if guild.me:
+                self._bot_members[guild.id] = guild.me
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        if guild.me:
+            self._bot_members[guild.id] = guild.me
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._bot_members.pop(guild.id, None)
+        for key in [key for key in self._missing_embeds if key[0] == guild.id]:
+            self._missing_embeds.pop(key, None)
+        for channel in guild.voice_channels + guild.stage_channels:
+            _CHANNEL_INFO_CACHE.pop(channel.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        _CHANNEL_INFO_CACHE.pop(channel.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if self.bot.user and after.id == self.bot.user.id:
+            self._bot_members[after.guild.id] = after
+
+    @asynccontextmanager
+    async def _connect_lock(self, guild_id: int) -> AsyncIterator[None]:
+        """Serialise /connect per guild; the lock is dropped once nobody holds or awaits it."""
+        lock, users = self._connect_locks.get(guild_id) or (asyncio.Lock(), 0)
+        self._connect_locks[guild_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._connect_locks[guild_id]
+            if users <= 1:
+                del self._connect_locks[guild_id]
+            else:
+                self._connect_locks[guild_id] = (lock, users - 1)
+
+    def _bot_member(self, guild: discord.Guild) -> Optional[discord.Member]:
+        """Return the bot's member object for ``guild`` using the cog-level cache."""
+        me = self._bot_members.get(guild.id)
+        if me is None:
+            me = guild.me
+            if me is not None:
+                self._bot_members[guild.id] = me
+        return me
 
     @staticmethod
     def _channel_info(channel: discord.VoiceChannel | discord.StageChannel) -> str:
         """Return a human friendly description of a voice channel."""
-        return (
-            f"`{channel.name}` (`{channel.id}`)\n"
-            f"Bitrate `{channel.bitrate // 1000} kbps` • "
-            f"User limit `{channel.user_limit or '∞'}`"
+        name, bitrate, user_limit = channel.name, channel.bitrate, channel.user_limit
+        cached = _CHANNEL_INFO_CACHE.get(channel.id)
+        if cached and cached[:3] == (name, bitrate, user_limit):
+            return cached[3]
+        rendered = (
+            f"`{name}` (`{channel.id}`)\n"
+            f"Bitrate `{bitrate // 1000} kbps` • "
+            f"User limit `{user_limit or '∞'}`"
         )
+        if channel.id not in _CHANNEL_INFO_CACHE and len(_CHANNEL_INFO_CACHE) >= CHANNEL_INFO_MAX_ENTRIES:
+            _CHANNEL_INFO_CACHE.pop(next(iter(_CHANNEL_INFO_CACHE)))
+        _CHANNEL_INFO_CACHE[channel.id] = (name, bitrate, user_limit, rendered)
+        return rendered
 
-    def _permissions_summary(
+    @staticmethod
+    def _channel_perms(member: discord.Member, channel: discord.VoiceChannel | discord.StageChannel) -> int:
+        """Return ``channel.permissions_for(member).value``, cached until roles/overwrites change."""
+        value = permission_cache.get("voice_perms", channel.guild.id, member.id, channel.id)
+        if value is None:
+            value = channel.permissions_for(member).value
+            permission_cache.set("voice_perms", channel.guild.id, member.id, channel.id, value)
+        return value
+
+    def _missing_perms(
         self, member: discord.Member, channel: discord.VoiceChannel | discord.StageChannel
-    ) -> tuple[str, list[str]]:
+    ) -> list[str]:
+        """Return labels of required voice capabilities ``member`` lacks in ``channel``."""
+        value = self._channel_perms(member, channel)
+        return [label for _, label, bit in _PERM_TABLE if not value & bit]
+
+    def _format_perms(self, member: discord.Member, channel: discord.VoiceChannel | discord.StageChannel) -> str:
         """List permission status for required voice capabilities."""
-        perms = channel.permissions_for(member)
-        lines = []
-        missing = []
-        for attr in REQUIRED_VOICE_PERMS:
-            label = attr.replace("_", " ").title()
-            granted = getattr(perms, attr, False)
-            icon = "✅" if granted else "❌"
-            lines.append(f"{icon} {label}")
-            if not granted:
-                missing.append(attr)
-        return "\n".join(lines), missing
+        value = self._channel_perms(member, channel)
+        return "\n".join(f"{'✅' if value & bit else '❌'} {label}" for _, label, bit in _PERM_TABLE)
+
+    def _missing_perms_embed(self, factory: EmbedFactory, guild_id: int, missing: list[str]) -> discord.Embed:
+        """Return a copy of the cached "missing permissions" embed for this guild/permission set."""
+        key = (guild_id, frozenset(missing))
+        cached = self._missing_embeds.get(key)
+        if cached is None or cached[0] is not factory:
+            missing_lines = "\n".join(f"- {label}" for label in missing)
+            embed = factory.error("I am missing voice permissions in this channel:", missing_lines)
+            cached = self._missing_embeds[key] = (factory, embed)
+        return cached[1].copy()
 
     @staticmethod
     def _find_player(bot: VectoBeat, guild_id: int) -> Optional[lavalink.DefaultPlayer]:
@@ -71,63 +163,68 @@ class ConnectionCommands(commands.Cog):
                     logger.debug("Failed to refresh Lavalink nodes: %s", exc)
 
     # ------------------------------------------------------------------ commands
-    async def _configure_player(self, player: lavalink.DefaultPlayer, guild: discord.Guild, channel: discord.abc.GuildChannel) -> None:
+    async def _configure_player(self, player: VectoPlayer, guild: discord.Guild, channel: discord.abc.GuildChannel) -> None:
         """Apply guild-specific settings to the player after connection."""
-        player.store("text_channel_id", channel.id)
         manager = getattr(self.bot, "profile_manager", None)
-        settings_service = getattr(self.bot, "server_settings", None)
+        if not manager:
+            player.store("text_channel_id", channel.id)
+            return
 
-        if manager:
-            profile = manager.get(guild.id)
-            player.store("autoplay_enabled", profile.autoplay)
-            player.store("announcement_style", profile.announcement_style)
-            desired_volume = (
-                settings_service.global_default_volume() if settings_service else None
-            ) or profile.default_volume
+        profile = manager.get(guild.id)
+        updates: dict[str, Any] = {"text_channel_id": channel.id}
+        if player.fetch("autoplay_enabled") != profile.autoplay:
+            updates["autoplay_enabled"] = profile.autoplay
+        if player.fetch("announcement_style") != profile.announcement_style:
+            updates["announcement_style"] = profile.announcement_style
+        player.store_many(updates)
+        settings_service = getattr(self.bot, "server_settings", None)
+        desired_volume = (settings_service and settings_service.global_default_volume()) or profile.default_volume
 
-            if player.volume != desired_volume:
-                await player.set_volume(desired_volume)
+        if player.volume != desired_volume:
+            await player.set_volume(desired_volume)
 
     @app_commands.command(name="connect", description="Connect VectoBeat to your current voice channel.")
     async def connect(self, inter: discord.Interaction) -> None:
         """Connect the bot to the caller's voice channel with diagnostics."""
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
-
         if not inter.guild:
             await inter.response.send_message(GUILD_ONLY_MSG, ephemeral=True)
             return
-        assert inter.guild is not None
+        factory = get_embed_factory(inter.guild.id)
 
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         voice = getattr(member, "voice", None)
         if not member or not voice or not voice.channel:
             error_embed = factory.error("You must be in a voice channel.")
             await inter.response.send_message(embed=error_embed, ephemeral=True)
             return
 
-        async with self._connect_lock:
+        async with self._connect_lock(inter.guild.id):
             await self._ensure_ready()
             
             if not getattr(self, "bot", None):
                 return
 
-            player = self._find_player(self.bot, inter.guild.id)
+            client = getattr(self.bot, "lavalink", None)
+            players = client.player_manager if client else None
+            player = players.get(inter.guild.id) if players else None
             if player and player.is_connected:
                 embed = factory.warning("Already connected.")
                 if player.channel_id:
-                    vc = inter.client.get_channel(int(player.channel_id))
+                    vc = inter.guild.get_channel(int(player.channel_id))
                     if isinstance(vc, (discord.VoiceChannel, discord.StageChannel)):
                         embed.add_field(name="Channel", value=self._channel_info(vc), inline=False)
                 await inter.response.send_message(embed=embed, ephemeral=True)
                 return
 
-            if getattr(self.bot, "lavalink", None) and not self.bot.lavalink.node_manager.available_nodes:
+            # Node ready/disconnect events keep the manager's counter current; no per-call scan.
+            manager = getattr(self.bot, "lavalink_manager", None)
+            if client and manager and manager.available_node_count == 0:
                 await inter.response.send_message(
                     embed=factory.error("Lavalink node is offline. Please check connectivity."), ephemeral=True
                 )
                 return
 
-            me = inter.guild.me or inter.guild.get_member(getattr(self.bot.user, "id", 0))
+            me = self._bot_member(inter.guild)
             channel = voice.channel
             if not isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
                 await inter.response.send_message("I can only join standard voice and stage channels.", ephemeral=True)
@@ -137,13 +234,9 @@ class ConnectionCommands(commands.Cog):
                 await inter.response.send_message("Unable to resolve bot member.", ephemeral=True)
                 return
 
-            summary, missing = self._permissions_summary(me, channel)
+            missing = self._missing_perms(me, channel)
             if missing:
-                missing_lines = "\n".join(f"- {attr.replace('_', ' ').title()}" for attr in missing)
-                embed = factory.error(
-                    "I am missing voice permissions in this channel:",
-                    missing_lines,
-                )
+                embed = self._missing_perms_embed(factory, inter.guild.id, missing)
                 await inter.response.send_message(embed=embed, ephemeral=True)
                 return
 
@@ -170,22 +263,22 @@ class ConnectionCommands(commands.Cog):
                 )
                 return
             
-            player = self._find_player(self.bot, inter.guild.id)
+            player = players.get(inter.guild.id) if players else None
             if player and isinstance(inter.channel, (discord.TextChannel, discord.VoiceChannel, discord.StageChannel, discord.Thread)):
                 await self._configure_player(player, inter.guild, inter.channel)  # type: ignore
 
             connection_details = f"Joined voice channel:\n{self._channel_info(channel)}"
             embed = factory.success("Connected", connection_details)
-            embed.add_field(name="Permissions", value=summary, inline=False)
+            embed.add_field(name="Permissions", value=self._format_perms(me, channel), inline=False)
             await inter.response.send_message(embed=embed)
 
     @app_commands.command(name="disconnect", description="Disconnect VectoBeat from the voice channel.")
     async def disconnect(self, inter: discord.Interaction) -> None:
         """Disconnect from voice and destroy the Lavalink player."""
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
         if not inter.guild:
             await inter.response.send_message(GUILD_ONLY_MSG, ephemeral=True)
             return
+        factory = get_embed_factory(inter.guild.id)
 
         voice_client = inter.guild.voice_client
         player = self._find_player(self.bot, inter.guild.id)
@@ -215,13 +308,13 @@ class ConnectionCommands(commands.Cog):
     @app_commands.command(name="voiceinfo", description="Show VectoBeat's current voice connection status.")
     async def voiceinfo(self, inter: discord.Interaction) -> None:
         """Display diagnostics for the current voice session."""
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
         if not inter.guild:
             await inter.response.send_message(GUILD_ONLY_MSG, ephemeral=True)
             return
+        factory = get_embed_factory(inter.guild.id)
 
-        player = self._find_player(self.bot, inter.guild.id)
         voice_client = inter.guild.voice_client
+        player = self._find_player(self.bot, inter.guild.id) if voice_client else None
 
         if not player or not player.is_connected or not voice_client:
             warning_embed = factory.warning("VectoBeat is not connected.")
@@ -237,16 +330,20 @@ class ConnectionCommands(commands.Cog):
         embed = factory.primary("🔊 Voice Session")
         embed.add_field(name="Channel", value=f"`{channel.name}` (`{channel.id}`)", inline=False)
 
-        latencies = getattr(self.bot, "latencies", [])
-        shard_latency = next((lat for sid, lat in latencies if sid == inter.guild.shard_id), getattr(self.bot, "latency", 0))
-        embed.add_field(name="Gateway Latency", value=f"`{shard_latency*1000:.2f} ms`", inline=True)
-        embed.add_field(name="Players Active", value=f"`{player.is_playing}`", inline=True)
-        embed.add_field(name="Queue Size", value=f"`{len(getattr(player, 'queue', []))}`", inline=True)
+        monitor = getattr(self.bot, "latency_monitor", None)
+        shard_latency_ms = monitor.shard_latency_ms(inter.guild.shard_id) if monitor else None
+        if shard_latency_ms is None:
+            shard_latency_ms = getattr(self.bot, "latency", 0) * 1000
+        add_fields(
+            embed,
+            ("Gateway Latency", f"`{shard_latency_ms:.2f} ms`", True),
+            ("Players Active", f"`{player.is_playing}`", True),
+            ("Queue Size", f"`{len(getattr(player, 'queue', []))}`", True),
+        )
 
-        me = inter.guild.me or inter.guild.get_member(getattr(self.bot.user, "id", 0))
+        me = self._bot_member(inter.guild)
         if me and isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
-            summary, _ = self._permissions_summary(me, channel)
-            embed.add_field(name="Permissions", value=summary, inline=False)
+            embed.add_field(name="Permissions", value=self._format_perms(me, channel), inline=False)
 
         await inter.response.send_message(embed=embed, ephemeral=True)
 
@@ -12,7 +12,8 @@ if TYPE_CHECKING:
     from src.main import VectoBeat
 
 from src.services.dj_permission_service import DJPermissionManager
-from src.utils.embeds import EmbedFactory
+from src.utils.discord_cache import interaction_member
+from src.utils.embeds import get_embed_factory
 
 
 def _manager(bot: "VectoBeat") -> DJPermissionManager:
@@ -27,6 +28,12 @@ class DJCommands(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = cast("VectoBeat", bot)
+        self._mgr: Optional[DJPermissionManager] = None
+
+    def _manager(self) -> DJPermissionManager:
+        if self._mgr is None:
+            self._mgr = _manager(self.bot)
+        return self._mgr
 
     dj = app_commands.Group(
         name="dj",
@@ -39,8 +46,8 @@ class DJCommands(commands.Cog):
     def _ensure_manage_guild(inter: discord.Interaction) -> Optional[str]:
         if not inter.guild:
             return "This command can only be used inside a guild."
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
-        if not isinstance(member, discord.Member):
+        member = interaction_member(inter)
+        if member is None:
             return "Unable to resolve invoking member."
         if not member.guild_permissions.manage_guild:
             return "You require the `Manage Server` permission to configure DJ roles."
@@ -48,22 +55,18 @@ class DJCommands(commands.Cog):
 
     @staticmethod
     def _role_mentions(guild: discord.Guild, role_ids: list[int]) -> str:
-        mentions = []
-        for role_id in role_ids:
-            role = guild.get_role(role_id)
-            if role:
-                mentions.append(role.mention)
-        return ", ".join(mentions) if mentions else "`(missing roles)`"
+        get_role = guild.get_role
+        return ", ".join([role.mention for role_id in role_ids if (role := get_role(role_id))]) or "`(missing roles)`"
 
     # ------------------------------------------------------------------ commands
     @dj.command(name="show", description="Display configured DJ roles and recent actions.")
     async def show(self, inter: discord.Interaction) -> None:
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
         if not inter.guild:
             await inter.response.send_message("Guild only command.", ephemeral=True)
             return
 
-        manager = _manager(self.bot)
+        factory = get_embed_factory(inter.guild.id)
+        manager = self._manager()
         roles = manager.get_roles(inter.guild.id)
         embed = factory.primary("DJ Permissions")
         if roles:
@@ -96,15 +99,15 @@ class DJCommands(commands.Cog):
             return
         assert inter.guild is not None
 
-        manager = _manager(self.bot)
-        await manager.add_role(inter.guild.id, role.id)
-        await manager.record_action(
+        manager = self._manager()
+        await manager.add_role(
             inter.guild.id,
-            inter.user,
-            "config:add-role",
+            role.id,
+            actor=inter.user,
+            action="config:add-role",
             details=f"Granted {role.name}",
         )
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id)
         embed = factory.success("DJ Role Added", f"{role.mention} can now control the queue.")
         await inter.response.send_message(embed=embed, ephemeral=True)
 
@@ -115,15 +118,15 @@ class DJCommands(commands.Cog):
             return
         assert inter.guild is not None
 
-        manager = _manager(self.bot)
-        await manager.remove_role(inter.guild.id, role.id)
-        await manager.record_action(
+        manager = self._manager()
+        await manager.remove_role(
             inter.guild.id,
-            inter.user,
-            "config:remove-role",
+            role.id,
+            actor=inter.user,
+            action="config:remove-role",
             details=f"Revoked {role.name}",
         )
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id)
         embed = factory.success("DJ Role Removed", f"{role.mention} can no longer control the queue.")
         await inter.response.send_message(embed=embed, ephemeral=True)
 
@@ -134,15 +137,15 @@ class DJCommands(commands.Cog):
             return
         assert inter.guild is not None
 
-        manager = _manager(self.bot)
-        await manager.set_roles(inter.guild.id, [])
-        await manager.record_action(
+        manager = self._manager()
+        await manager.set_roles(
             inter.guild.id,
-            inter.user,
-            "config:clear-roles",
+            [],
+            actor=inter.user,
+            action="config:clear-roles",
             details="All DJ roles cleared",
         )
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id)
         embed = factory.warning("DJ Restrictions Cleared", "Anyone may manage the queue until roles are re-added.")
         await inter.response.send_message(embed=embed, ephemeral=True)
 
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import functools
 from collections import defaultdict
-from typing import Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from src.utils.embeds import add_fields
 
+
+@functools.lru_cache(maxsize=None)
 def _module_to_category(module: Optional[str]) -> str:
     if not module:
         return "General"
@@ -17,7 +22,49 @@ def _module_to_category(module: Optional[str]) -> str:
     return module.replace("_", " ").title() or "General"
 
 
+def _iter_flattened(root: app_commands.Command | app_commands.Group) -> Iterable[Tuple[str, str, str]]:
+    # Explicit stack with pre-joined prefixes; children are pushed reversed to keep declaration order.
+    stack: List[Tuple[app_commands.Command | app_commands.Group, str]] = [(root, "")]
+    while stack:
+        command, prefix = stack.pop()
+        path = f"{prefix} {command.name}" if prefix else command.name
+        if isinstance(command, app_commands.Group):
+            stack.extend((child, path) for child in reversed(command.commands))
+            continue
+
+        description = command.description or "No description provided."
+        callback = getattr(command, "callback", None)
+        category = _module_to_category(getattr(callback, "__module__", None))
+        yield (category, f"/{path}", description)
+
+
+@functools.lru_cache(maxsize=256)
+def _flatten_cached(command: app_commands.Command | app_commands.Group) -> Tuple[Tuple[str, str, str], ...]:
+    """Flattened ``(category, full_name, description)`` rows for a root command, memoised per object."""
+    return tuple(_iter_flattened(command))
+
+
+@dataclass
+class _HelpSnapshot:
+    """Everything /help derives from one command-tree version, built together and shared."""
+
+    # ``bot.command_tree_revision`` the snapshot was built from.
+    revision: int
+    entries: List[Tuple[str, str, str]]
+    # lowercase full name -> (category, full name, description)
+    index: Dict[str, Tuple[str, str, str]]
+    pages: List[discord.Embed]
+    categories: List[str]
+    # lowercase full name -> resolved command object (filled lazily by detail lookups)
+    command_objects: Dict[str, Optional[app_commands.Command | app_commands.Group]] = field(default_factory=dict)
+
+
 class HelpPaginationView(discord.ui.View):
+    """Page through help embeds.
+
+    The embeds are shared with :class:`HelpCommands`' page cache and must not be mutated here.
+    """
+
     def __init__(self, pages: Sequence[discord.Embed], categories: Sequence[str]) -> None:
         super().__init__(timeout=180)
         self.pages = list(pages)
@@ -73,35 +120,42 @@ class HelpCommands(commands.Cog):
         from typing import cast, Any
         from src.main import VectoBeat
         self.bot: VectoBeat = cast(Any, bot)
+        # Rebuilt only when a cog is added or removed (tracked by ``bot.command_tree_revision``).
+        self._snap: Optional[_HelpSnapshot] = None
+
+    def _snapshot(self) -> _HelpSnapshot:
+        revision = self.bot.command_tree_revision
+        snap = self._snap
+        if snap is None or snap.revision != revision:
+            _flatten_cached.cache_clear()
+            entries = self._entries()
+            pages = self._build_pages(entries)
+            snap = _HelpSnapshot(
+                revision=revision,
+                entries=entries,
+                index={full.lower(): (category, full, desc) for category, full, desc in entries},
+                pages=pages,
+                categories=[page.title or "General" for page in pages],
+            )
+            self._snap = snap
+        return snap
 
-    def _flatten_command(
-        self,
-        command: app_commands.Command | app_commands.Group,
-        parents: Optional[List[str]] = None,
-    ) -> Iterable[Tuple[str, str, str]]:
-        parents = parents or []
-        if isinstance(command, app_commands.Group):
-            for child in command.commands:
-                yield from self._flatten_command(child, parents + [command.name])
-            return
-
-        full_name = "/" + " ".join(parents + [command.name])
-        description = command.description or "No description provided."
-
-        callback = getattr(command, "callback", None)
-        module = getattr(callback, "__module__", None)
-        category = _module_to_category(module)
-        yield (category, full_name, description)
-
-    def _build_pages(self) -> List[discord.Embed]:
+    def _entries(self) -> List[Tuple[str, str, str]]:
         entries: List[Tuple[str, str, str]] = []
         for command in self.bot.tree.get_commands():
             if isinstance(command, (app_commands.Command, app_commands.Group)):
                 entries.extend(self._flatten_command(command))
+        return entries
 
+    def _flatten_command(self, command: app_commands.Command | app_commands.Group) -> Tuple[Tuple[str, str, str], ...]:
+        return _flatten_cached(command)
+
+    def _build_pages(self, entries: List[Tuple[str, str, str]]) -> List[discord.Embed]:
         grouped = defaultdict(list)
-        for category, name, description in sorted(entries, key=lambda item: (item[0], item[1])):
+        for category, name, description in entries:
             grouped[category].append((name, description))
+        for commands_list in grouped.values():
+            commands_list.sort(key=lambda item: item[0])
 
         pages: List[discord.Embed] = []
         if not grouped:
@@ -113,29 +167,47 @@ class HelpCommands(commands.Cog):
             pages.append(embed)
             return pages
 
-        for category, commands_list in grouped.items():
+        for category in sorted(grouped):
+            commands_list = grouped[category]
             embed = discord.Embed(
                 title=f"{category} Commands",
                 description="Browse the available slash commands for this bot.",
                 color=discord.Color.blurple(),
             )
-            for name, description in commands_list:
-                embed.add_field(name=name, value=description, inline=False)
+            add_fields(embed, *((name, description, False) for name, description in commands_list))
             embed.set_footer(text=f"{len(commands_list)} command(s)")
             pages.append(embed)
         return pages
 
     def _find_command_match(self, name: str) -> Optional[Tuple[str, str, str]]:
-        targets: List[Tuple[str, str, str]] = []
-        for command in self.bot.tree.get_commands():
-            if isinstance(command, (app_commands.Command, app_commands.Group)):
-                targets.extend(self._flatten_command(command))
-        lookup = {full.lower(): (category, desc) for category, full, desc in targets}
-        for key, (category, desc) in lookup.items():
-            if key == name.lower() or key.endswith(f" {name.lower()}") or key.lstrip("/").lower() == name.lower():
+        index = self._snapshot().index
+        lowered = name.lower()
+        key = lowered if lowered.startswith("/") else f"/{lowered}"
+        hit = index.get(key)
+        if hit:
+            return key, hit[0], hit[2]
+        for key, (category, _, desc) in index.items():
+            if key.endswith(f" {lowered}"):
                 return key, category, desc
         return None
 
+    def _resolve_command(self, key: str) -> Optional[app_commands.Command | app_commands.Group]:
+        """Resolve ``/group sub`` style names by descending the tree instead of scanning it."""
+        snap = self._snapshot()
+        if key in snap.command_objects:
+            return snap.command_objects[key]
+        _, full, _ = snap.index[key]
+        parts = full.lstrip("/").split()
+        node = self.bot.tree.get_command(parts[0]) if parts else None
+        for part in parts[1:]:
+            if not isinstance(node, app_commands.Group):
+                node = None
+                break
+            node = node.get_command(part)
+        resolved = node if isinstance(node, (app_commands.Command, app_commands.Group)) else None
+        snap.command_objects[key] = resolved
+        return resolved
+
     def _format_command_parameters(self, cmd_obj: app_commands.Command) -> List[str]:
         parameters: List[str] = []
         for param in cmd_obj.parameters:
@@ -151,8 +223,8 @@ class HelpCommands(commands.Cog):
         if not match:
             return None
 
-        cmd_obj = next((c for c in self.bot.tree.get_commands() if isinstance(c, (app_commands.Command, app_commands.Group)) and match[0].lstrip("/") == c.qualified_name), None)
-        
+        cmd_obj = self._resolve_command(match[0])
+
         parameters = []
         if isinstance(cmd_obj, app_commands.Command):
             parameters = self._format_command_parameters(cmd_obj)
@@ -182,21 +254,22 @@ class HelpCommands(commands.Cog):
             await interaction.response.send_message(embed=detail, ephemeral=True)
             return
 
-        pages = self._build_pages()
-        categories = [page.title or "General" for page in pages]
-        view = HelpPaginationView(pages, categories)
+        # Cached embeds are shared read-only; the pagination view only swaps which page is shown.
+        snap = self._snapshot()
+        pages = snap.pages
+        view = HelpPaginationView(pages, snap.categories)
         await interaction.response.send_message(embed=pages[0], view=view, ephemeral=True)
 
     @help.autocomplete("command")
     async def help_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-        entries: List[Tuple[str, str, str]] = []
-        for command in self.bot.tree.get_commands():
-            if isinstance(command, (app_commands.Command, app_commands.Group)):
-                entries.extend(self._flatten_command(command))
-        values = [name for _, name, _ in entries]
         current_lower = current.lower()
-        filtered = [v for v in values if current_lower in v.lower()][:25]
-        return [app_commands.Choice(name=v, value=v) for v in filtered]
+        choices: List[app_commands.Choice[str]] = []
+        for key, (_, full, _) in self._snapshot().index.items():
+            if current_lower in key:
+                choices.append(app_commands.Choice(name=full, value=full))
+                if len(choices) == 25:
+                    break
+        return choices
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -4,18 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import heapq
+import operator
 import os
 import platform
-import statistics
 import time
-from typing import Any, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from src.services.health_service import HealthState
-from src.utils.embeds import EmbedFactory
+from src.utils.embeds import add_fields, get_embed_factory
 from src.configs.settings import VERSION
 
 try:  # Optional dependency for richer process metrics
@@ -23,6 +25,151 @@ try:  # Optional dependency for richer process metrics
 except ImportError:  # pragma: no cover - psutil not installed
     psutil = None
 
+_perf = time.perf_counter
+_wait_for = asyncio.wait_for
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_NODES_TTL = 0.25
+_LAVALINK_VIEW_TTL = 1.0
+_BACKEND_TTL = 0.5
+_PROBE_GRACE = 0.25
+_APPINFO_TTL = 300.0
+_THIN_SPACE = str.maketrans({",": "\u2009"})  # thin space group separators
+_CPU_FIELDS = ("system_load", "lavalink_load", "cores")
+_MEM_FIELDS = ("used", "allocated", "free", "reservable")
+_FRAME_FIELDS = ("sent", "deficit", "nulled")
+_FIELD_GETTERS = {fields: operator.attrgetter(*fields) for fields in (_CPU_FIELDS, _MEM_FIELDS, _FRAME_FIELDS)}
+
+
+def _stat(source: Any, key: str, default: Any = None) -> Any:
+    """Read ``key`` from a Lavalink stats object or its raw dict payload."""
+    if source is None:
+        return default
+    if isinstance(source, dict):
+        return source.get(key, default)
+    return getattr(source, key, default)
+
+
+def _stat_fields(source: Any, fields: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """Read every name in ``fields`` from ``source`` in one sweep."""
+    if source is None:
+        return (None,) * len(fields)
+    if isinstance(source, dict):
+        return tuple(source.get(field) for field in fields)
+    try:
+        return _FIELD_GETTERS[fields](source)
+    except AttributeError:
+        return tuple(getattr(source, field, None) for field in fields)
+
+
+# Interpreter, library and host details never change for the life of the process.
+_RUNTIME_INFO = "\n".join(
+    [
+        f"Python `{platform.python_version()}`",
+        f"discord.py `{discord.__version__}`",
+        f"Host `{platform.system()} {platform.release()}`",
+    ]
+)
+_OWNER_NAME_ATTRS = ("global_name", "display_name", "name")
+_ROLE_POSITION = operator.attrgetter("position")
+_IS_BOT = operator.attrgetter("bot")
+
+
+def _first_attr(source: Any, names: Tuple[str, ...]) -> Any:
+    """Return the first truthy attribute of ``source`` among ``names``."""
+    for name in names:
+        value = getattr(source, name, None)
+        if value:
+            return value
+    return None
+
+
+_FEATURE_LABELS = {
+    "ANIMATED_BANNER": "Animated Banner",
+    "ANIMATED_ICON": "Animated Icon",
+    "BANNER": "Banner",
+    "COMMUNITY": "Community",
+    "DISCOVERABLE": "Discoverable",
+    "FEATURES_HUB": "Features Hub",
+    "INVITE_SPLASH": "Invite Splash",
+    "MEMBER_VERIFICATION_GATE_ENABLED": "Membership Screening",
+    "NEWS": "News Channels",
+    "PARTNERED": "Partnered",
+    "PREVIEW_ENABLED": "Preview",
+    "PRIVATE_THREADS": "Private Threads",
+    "ROLE_ICONS": "Role Icons",
+    "TICKETED_EVENTS_ENABLED": "Ticketed Events",
+    "VANITY_URL": "Vanity URL",
+    "VERIFIED": "Verified",
+    "VIP_REGIONS": "VIP Regions",
+}
+
+# (attribute, label) rows shown by /permissions.
+_RECOMMENDED_PERMS = (
+    ("view_channel", "View Channel"),
+    ("send_messages", "Send Messages"),
+    ("embed_links", "Embed Links"),
+    ("attach_files", "Attach Files"),
+    ("add_reactions", "Add Reactions"),
+    ("use_external_emojis", "Use External Emojis"),
+    ("read_message_history", "Read Message History"),
+    ("use_slash_commands", "Use Application Commands"),
+)
+_VOICE_PERMS = (
+    ("connect", "Connect"),
+    ("speak", "Speak"),
+    ("use_voice_activation", "Use Voice Activity"),
+    ("stream", "Video/Stream"),
+    ("priority_speaker", "Priority Speaker"),
+)
+_MODERATION_PERMS = (
+    ("manage_messages", "Manage Messages"),
+    ("move_members", "Move Members"),
+    ("mute_members", "Mute Members"),
+    ("deafen_members", "Deafen Members"),
+)
+_ELEVATED_PERMS = (
+    ("administrator", "Administrator"),
+    ("manage_guild", "Manage Guild"),
+    ("manage_roles", "Manage Roles"),
+)
+
+
+def _render_perms(
+    perms: discord.Permissions, section: Tuple[Tuple[str, str], ...], icon: Callable[[bool], str]
+) -> str:
+    """Render ``section`` as checklist lines against ``perms``."""
+    return "\n".join(f"{icon(getattr(perms, key, False))} {label}" for key, label in section)
+
+
+@lru_cache(maxsize=128)
+def _feature_label(feature: str) -> str:
+    """Return the display label for a guild feature flag."""
+    return _FEATURE_LABELS.get(feature) or feature.replace("_", " ").title()
+
+
+@lru_cache(maxsize=4096)
+def _duration_label(seconds: int) -> str:
+    days, rem = divmod(seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    if days:
+        return f"{days}d {hours}h {minutes}m {secs}s"
+    if hours:
+        return f"{hours}h {minutes}m {secs}s"
+    return f"{minutes}m {secs}s"
+
+
+@lru_cache(maxsize=4)
+def _footer_text(bot_name: str) -> str:
+    return f"VectoBeat v{VERSION} | {bot_name}"
+
+
+@lru_cache(maxsize=4)
+def _timestamp_labels(timestamp: float) -> Tuple[str, str]:
+    """Return the full and relative Discord timestamp markup for a fixed boot time."""
+    dt = datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+    return discord.utils.format_dt(dt, style="F"), discord.utils.format_dt(dt, style="R")
+
 
 class InfoCommands(commands.Cog):
     """Diagnostic commands for VectoBeat."""
@@ -32,37 +179,84 @@ class InfoCommands(commands.Cog):
         from src.main import VectoBeat
         self.bot: VectoBeat = cast(Any, bot)
         self._status_lock = asyncio.Lock()
+        # (node_manager id, captured_at, nodes) shared by /ping, /status and /lavalink.
+        self._nodes_cache: Tuple[int, float, list[dict[str, Any]]] = (0, 0.0, [])
+        self._node_summary_cache: Tuple[int, float, list[dict[str, Any]]] = (0, 0.0, [])
+        # cpu_percent() is only meaningful between periodic calls, so a background
+        # loop samples the process and commands read the cached tuple.
+        self._proc = psutil.Process(os.getpid()) if psutil else None
+        self._metrics: Tuple[Optional[float], Optional[float]] = (None, None)
+        # (command_tree_revision, top-level command count)
+        self._command_count_cache: Optional[Tuple[int, int]] = None
+        self._backend_cache: Tuple[float, list[Tuple[str, Optional[float], bool]]] = (float("-inf"), [])
+        self._backend_probe: Optional[asyncio.Task] = None
+        # (fetched_at, AppInfo); application metadata changes on a minutes-to-hours scale.
+        self._appinfo_cache: Tuple[float, Optional[discord.AppInfo]] = (0.0, None)
+        # (bot_id, view) for the /permissions invite/FAQ buttons.
+        self._perms_view: Optional[Tuple[int, discord.ui.View]] = None
+        # guild_id -> cached bot member count, seeded on first /guildinfo.
+        self._guild_bot_counts: dict[int, int] = {}
+
+    async def cog_load(self) -> None:
+        self._metrics = await asyncio.to_thread(self._sample_process_metrics)
+        if not self.sample_metrics.is_running():
+            self.sample_metrics.start()
+
+    async def cog_unload(self) -> None:
+        self.sample_metrics.cancel()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        if member.bot and member.guild.id in self._guild_bot_counts:
+            self._guild_bot_counts[member.guild.id] += 1
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        count = self._guild_bot_counts.get(member.guild.id)
+        if member.bot and count:
+            self._guild_bot_counts[member.guild.id] = count - 1
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._guild_bot_counts.pop(guild.id, None)
+
+    @tasks.loop(seconds=5)
+    async def sample_metrics(self) -> None:
+        try:
+            # memory_full_info() parses /proc/self/smaps, so keep it off the event loop.
+            self._metrics = await asyncio.to_thread(self._sample_process_metrics)
+        except Exception:  # pragma: no cover - keep the sampler alive
+            bot_logger = getattr(self.bot, "logger", None)
+            if bot_logger:
+                bot_logger.debug("Failed to sample process metrics.", exc_info=True)
 
     # ------------------------------------------------------------------ helpers
     @staticmethod
     def _format_duration(seconds: float) -> str:
         """Convert seconds into a human friendly ``Xd Xh Xm Xs`` string."""
-        seconds = int(seconds)
-        days, rem = divmod(seconds, 86400)
-        hours, rem = divmod(rem, 3600)
-        minutes, secs = divmod(rem, 60)
-        fragments = []
-        if days:
-            fragments.append(f"{days}d")
-        if days or hours:
-            fragments.append(f"{hours}h")
-        fragments.append(f"{minutes}m")
-        fragments.append(f"{secs}s")
-        return " ".join(fragments)
+        # Normalise to whole seconds so callers within the same second share a cache entry.
+        return _duration_label(int(seconds))
 
     @staticmethod
     def _format_number(value: int) -> str:
         """Return a formatted integer with thin-space group separators."""
-        return f"{value:,}".replace(",", "\u2009")  # thin space separators
+        return format(value, ",").translate(_THIN_SPACE)
 
-    @staticmethod
-    def _process_metrics() -> Tuple[Optional[float], Optional[float]]:
-        """Return a tuple of (cpu_percent, memory_mb)."""
-        if psutil:
-            proc = psutil.Process(os.getpid())
+    def _process_metrics(self) -> Tuple[Optional[float], Optional[float]]:
+        """Return the most recent (cpu_percent, memory_mb) sample."""
+        return self._metrics
+
+    def _sample_process_metrics(self) -> Tuple[Optional[float], Optional[float]]:
+        """Read (cpu_percent, memory_mb) for this process."""
+        proc = self._proc
+        if proc is not None:
             with proc.oneshot():
-                cpu_percent = proc.cpu_percent(interval=0.0)
-                mem_mb = proc.memory_full_info().uss / (1024**2)
+                cpu_percent = proc.cpu_percent(interval=None)
+                try:
+                    mem_bytes = proc.memory_full_info().uss
+                except Exception:  # smaps may be unreadable; rss is always available
+                    mem_bytes = proc.memory_info().rss
+                mem_mb = mem_bytes / (1024**2)
             return cpu_percent, mem_mb
         try:  # pragma: no cover - platform specific fallback
             import resource  # type: ignore
@@ -72,6 +266,63 @@ class InfoCommands(commands.Cog):
         except Exception:
             return None, None
 
+    def _command_count(self) -> int:
+        """Return the number of top-level app commands, recounted after cog changes."""
+        revision = getattr(self.bot, "command_tree_revision", None)
+        cached = self._command_count_cache
+        if revision is not None and cached and cached[0] == revision:
+            return cached[1]
+        count = len(self.bot.tree.get_commands())
+        if revision is not None:
+            self._command_count_cache = (revision, count)
+        return count
+
+    async def _app_info(self) -> discord.AppInfo:
+        """Return the application info, refetching at most every ``_APPINFO_TTL`` seconds."""
+        now = time.monotonic()
+        fetched_at, cached = self._appinfo_cache
+        if cached is not None and now - fetched_at < _APPINFO_TTL:
+            return cached
+        info = await self.bot.application_info()
+        self._appinfo_cache = (now, info)
+        return info
+
+    def _permissions_view(self) -> discord.ui.View:
+        """Return the shared link-button view for /permissions, built once the bot id is known."""
+        bot_id = self.bot.user.id if self.bot.user else 0
+        cached = self._perms_view
+        if cached is not None and cached[0] == bot_id:
+            return cached[1]
+        invite_url = (
+            f"https://discord.com/api/oauth2/authorize?client_id={bot_id}"
+            "&permissions=36768832&scope=bot%20applications.commands%20identify"
+        )
+        # Link buttons carry no callback state, so one view can back every reply.
+        view = discord.ui.View(timeout=None)
+        view.add_item(discord.ui.Button(style=discord.ButtonStyle.link, url=invite_url, label="Invite (recommended)"))
+        view.add_item(
+            discord.ui.Button(
+                style=discord.ButtonStyle.link,
+                url="https://support.discord.com/hc/en-us/articles/206029707-Setting-Up-Permissions-FAQ",
+                label="Permissions FAQ",
+            )
+        )
+        self._perms_view = (bot_id, view)
+        return view
+
+    def _bot_count(self, guild: discord.Guild) -> int:
+        """Return the number of bot members in ``guild``.
+
+        Counts are only kept once the guild is fully chunked; a partial member
+        cache would otherwise pin an undercount.
+        """
+        count = self._guild_bot_counts.get(guild.id)
+        if count is None:
+            count = sum(map(_IS_BOT, guild.members))
+            if guild.chunked:
+                self._guild_bot_counts[guild.id] = count
+        return count
+
     def _lavalink_metrics(self) -> Tuple[int, int, int]:
         """Return Lavalink metrics (players, active players, queued tracks)."""
         lavalink = getattr(self.bot, "lavalink", None)
@@ -83,21 +334,54 @@ class InfoCommands(commands.Cog):
         queued_tracks = sum(len(getattr(p, "queue", [])) for p in players)
         return total_players, active_players, queued_tracks
 
-    def _lavalink_nodes(self) -> list[dict[str, Any]]:
-        """Return a list of node statistics dictionaries."""
+    def _lavalink_node_summary(self, max_age: float = _NODES_TTL) -> list[dict[str, Any]]:
+        """Return just the name/region/player counts /ping shows for each node.
+
+        A fresh full snapshot is reused when available; otherwise only these four
+        fields are read instead of the complete per-node stats walk.
+        """
+        lavalink = getattr(self.bot, "lavalink", None)
+        if not lavalink:
+            return []
+
+        node_manager = lavalink.node_manager
+        now = time.monotonic()
+        for cached_id, captured_at, cached in (self._nodes_cache, self._node_summary_cache):
+            if cached_id == id(node_manager) and now - captured_at < max_age:
+                return cached
+
+        summary = []
+        for node in node_manager.nodes:
+            stats = node.stats
+            summary.append(
+                {
+                    "name": node.name,
+                    "region": node.region,
+                    "players": getattr(stats, "players", 0),
+                    "playing": getattr(stats, "playing_players", 0),
+                }
+            )
+        self._node_summary_cache = (id(node_manager), now, summary)
+        return summary
+
+    def _lavalink_nodes(self, max_age: float = _NODES_TTL) -> list[dict[str, Any]]:
+        """Return a list of node statistics dictionaries.
+
+        A snapshot younger than ``max_age`` seconds is reused; callers must treat
+        it as read-only.
+        """
         lavalink = getattr(self.bot, "lavalink", None)
         if not lavalink:
             return []
 
-        def _stat(source: Any, key: str, default: Any = None) -> Any:
-            if source is None:
-                return default
-            if isinstance(source, dict):
-                return source.get(key, default)
-            return getattr(source, key, default)
+        node_manager = lavalink.node_manager
+        now = time.monotonic()
+        cached_id, captured_at, cached = self._nodes_cache
+        if cached_id == id(node_manager) and now - captured_at < max_age:
+            return cached
 
         nodes = []
-        for node in lavalink.node_manager.nodes:
+        for node in node_manager.nodes:
             stats = node.stats
             rest = getattr(node, "rest", None)
             raw_uri = getattr(rest, "uri", None)
@@ -112,8 +396,9 @@ class InfoCommands(commands.Cog):
                 elif lowered.startswith("http://"):
                     ssl_flag = False
 
-            cpu_stats = _stat(stats, "cpu")
-            mem_stats = _stat(stats, "memory")
+            cpu_system, cpu_lavalink, cpu_cores = _stat_fields(_stat(stats, "cpu"), _CPU_FIELDS)
+            mem_used, mem_allocated, mem_free, mem_reservable = _stat_fields(_stat(stats, "memory"), _MEM_FIELDS)
+            frames, deficit, nulled = _stat_fields(_stat(stats, "frame_stats"), _FRAME_FIELDS)
             nodes.append(
                 {
                     "name": node.name,
@@ -123,43 +408,73 @@ class InfoCommands(commands.Cog):
                     "players": getattr(stats, "players", 0),
                     "playing": getattr(stats, "playing_players", 0),
                     "uptime_ms": _stat(stats, "uptime"),
-                    "cpu_system": _stat(cpu_stats, "system_load"),
-                    "cpu_lavalink": _stat(cpu_stats, "lavalink_load"),
-                    "cpu_cores": _stat(cpu_stats, "cores"),
-                    "memory_used": _stat(mem_stats, "used"),
-                    "memory_allocated": _stat(mem_stats, "allocated"),
-                    "memory_free": _stat(mem_stats, "free"),
-                    "memory_reservable": _stat(mem_stats, "reservable"),
-                    "frames": _stat(_stat(stats, "frame_stats"), "sent"),
-                    "deficit": _stat(_stat(stats, "frame_stats"), "deficit"),
-                    "nulled": _stat(_stat(stats, "frame_stats"), "nulled"),
+                    "cpu_system": cpu_system,
+                    "cpu_lavalink": cpu_lavalink,
+                    "cpu_cores": cpu_cores,
+                    "memory_used": mem_used,
+                    "memory_allocated": mem_allocated,
+                    "memory_free": mem_free,
+                    "memory_reservable": mem_reservable,
+                    "frames": frames,
+                    "deficit": deficit,
+                    "nulled": nulled,
                     "penalties": getattr(stats, "penalty_total", None),
                 }
             )
+        self._nodes_cache = (id(node_manager), now, nodes)
         return nodes
 
     async def _timed_ping(self, label: str, coro: asyncio.Future, timeout: float = 1.5) -> Tuple[str, Optional[float], bool]:
         """Run a coroutine with a timeout and measure duration in ms."""
-        start = time.perf_counter()
+        start = _perf()
         try:
-            await asyncio.wait_for(coro, timeout=timeout)
-            duration = (time.perf_counter() - start) * 1000
-            return label, duration, True
+            await _wait_for(coro, timeout=timeout)
+            return label, (_perf() - start) * 1000.0, True
         except Exception:
             return label, None, False
 
+    async def _probe_backends(self) -> list[Tuple[str, Optional[float], bool]]:
+        """Return recent backend ping results, sharing one in-flight probe between callers."""
+        captured_at, results = self._backend_cache
+        if time.monotonic() - captured_at < _BACKEND_TTL:
+            return results
+        probe = self._backend_probe
+        if probe is None or probe.done():
+            probe = self._backend_probe = asyncio.create_task(self._run_backend_probes())
+        # Shield so a cancelled command does not abort the probe other callers await.
+        return await asyncio.shield(probe)
+
+    async def _run_backend_probes(self, timeout: float = 0.75) -> list[Tuple[str, Optional[float], bool]]:
+        """Ping the optional Redis-backed services concurrently."""
+        timed_ping = self._timed_ping
+        labels: list[str] = []
+        coros = []
+        for label, attr in (("Playlist (Redis)", "playlist_service"), ("Autoplay (Redis)", "autoplay_service")):
+            service = getattr(self.bot, attr, None)
+            if service and hasattr(service, "ping"):
+                labels.append(label)
+                coros.append(timed_ping(label, service.ping(), timeout))
+        pings: list[Tuple[str, Optional[float], bool]] = []
+        if coros:
+            # Each ping has its own timeout; the outer ceiling bounds the whole fan-out.
+            try:
+                results = await _wait_for(
+                    asyncio.gather(*coros, return_exceptions=True), timeout=timeout + _PROBE_GRACE
+                )
+            except asyncio.TimeoutError:
+                results = [(label, None, False) for label in labels]
+            pings = [result for result in results if not isinstance(result, BaseException)]
+        self._backend_cache = (time.monotonic(), pings)
+        return pings
+
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _format_bytes(num: Optional[int]) -> str:
         """Format a byte value into a human readable string."""
         if num is None:
             return "n/a"
-        num_f = float(num)
-        step_unit = 1024
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if num_f < step_unit:
-                return f"{num_f:.1f} {unit}"
-            num_f /= step_unit
-        return f"{num_f:.1f} PB"
+        index = min((int(num).bit_length() - 1) // 10, 5) if num >= 1024 else 0
+        return f"{num / (1 << (10 * index)):.1f} {_BYTE_UNITS[index]}"
 
     @staticmethod
     def _format_datetime(dt: Optional[datetime.datetime]) -> str:
@@ -185,9 +500,12 @@ class InfoCommands(commands.Cog):
 
         shard_pairs = [(sid, round(lat * 1000, 2)) for sid, lat in getattr(self.bot, "latencies", [])]
         latency_values = [lat for _, lat in shard_pairs] or [round(self.bot.latency * 1000, 2)]
+        count = len(latency_values)
         gateway_best = min(latency_values)
-        gateway_avg = statistics.mean(latency_values)
-        gateway_p95 = sorted(latency_values)[max(0, int(0.95 * (len(latency_values) - 1)))]
+        gateway_avg = sum(latency_values) / count
+        # Partial selection: only the lowest p95_index + 1 values are ordered.
+        p95_index = max(0, int(0.95 * (count - 1)))
+        gateway_p95 = heapq.nsmallest(p95_index + 1, latency_values)[-1] if count > 1 else gateway_best
         return gateway_best, gateway_avg, gateway_p95, shard_pairs, None
 
     @staticmethod
@@ -196,33 +514,26 @@ class InfoCommands(commands.Cog):
         team = getattr(app_info, "team", None)
         if team:
             team_name = getattr(team, "name", None) or f"Team {team.id}"
-            owner_member = next(
-                (member for member in getattr(team, "members", []) if getattr(member, "id", None) == getattr(team, "owner_id", None)),
-                None,
-            )
+            members_by_id = {getattr(member, "id", None): member for member in getattr(team, "members", ())}
+            owner_member = members_by_id.get(getattr(team, "owner_id", None))
             owner_user = getattr(owner_member, "user", None) if owner_member else None
-            owner_display = (
-                getattr(owner_user, "global_name", None)
-                or getattr(owner_user, "display_name", None)
-                or getattr(owner_user, "name", None)
-                or getattr(owner_member, "name", None)
-            )
+            owner_display = _first_attr(owner_user, _OWNER_NAME_ATTRS) or getattr(owner_member, "name", None)
             return f"{team_name} (Owner: {owner_display})" if owner_display else team_name
 
         owner = getattr(app_info, "owner", None)
         if owner:
-            return getattr(owner, "global_name", None) or getattr(owner, "display_name", None) or getattr(owner, "name", None) or str(owner)
+            return _first_attr(owner, _OWNER_NAME_ATTRS) or str(owner)
         return "Unknown"
 
     # ------------------------------------------------------------------ commands
     @app_commands.command(name="ping", description="Quick latency & uptime snapshot for VectoBeat.")
     async def ping(self, inter: discord.Interaction) -> None:
         """Provide a quick glance at latency, uptime and shard information."""
-        started_at = time.perf_counter()
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        started_at = _perf()
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
         uptime_seconds = int(HealthState.uptime())
         embed = factory.primary("🏓 VectoBeat Ping")
-        embed.set_footer(text=f"VectoBeat v{VERSION} | {self.bot.user.name if self.bot.user else 'Bot'}")
+        embed.set_footer(text=_footer_text(self.bot.user.name if self.bot.user else "Bot"))
 
         shard_total = self.bot.shard_count or max(1, len(getattr(self.bot, "shards", {})) or 1)
         shard_id = inter.guild.shard_id + 1 if inter.guild else "N/A"
@@ -230,26 +541,9 @@ class InfoCommands(commands.Cog):
         gateway_best, gateway_avg, gateway_p95, shard_latencies, loop_lag_ms = self._latency_snapshot()
 
         # Optional service pings gathered in parallel; kept short with timeouts.
-        pings: list[Tuple[str, Optional[float], bool]] = []
-        playlist_service = getattr(self.bot, "playlist_service", None)
-        autoplay_service = getattr(self.bot, "autoplay_service", None)
-        tasks = []
-        if playlist_service and hasattr(playlist_service, "ping"):
-            tasks.append(asyncio.create_task(self._timed_ping("Playlist (Redis)", playlist_service.ping())))
-        if autoplay_service and hasattr(autoplay_service, "ping"):
-            tasks.append(asyncio.create_task(self._timed_ping("Autoplay (Redis)", autoplay_service.ping())))
-
-        if tasks:
-            done, pending = await asyncio.wait(tasks, timeout=0.75)
-            for task in pending:
-                task.cancel()
-            for task in done:
-                try:
-                    pings.append(task.result())
-                except Exception:
-                    continue
+        pings = await self._probe_backends()
 
-        processing_ms = max(0.0, (time.perf_counter() - started_at) * 1000)
+        processing_ms = max(0.0, (_perf() - started_at) * 1000)
 
         embed.add_field(
             name="Gateway Latency",
@@ -263,7 +557,7 @@ class InfoCommands(commands.Cog):
             embed.add_field(name="Loop Lag", value=f"`{loop_lag_ms:.1f} ms`", inline=True)
 
         # Lavalink node visibility to highlight transport health.
-        nodes = self._lavalink_nodes()
+        nodes = self._lavalink_node_summary()
         if nodes:
             lines = []
             for node in nodes:
@@ -285,152 +579,136 @@ class InfoCommands(commands.Cog):
     @app_commands.command(name="status", description="Show detailed diagnostics for VectoBeat.")
     async def status(self, inter: discord.Interaction) -> None:
         """Provide deep diagnostics including latencies, guild footprint and process metrics."""
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
+        # Probes can eat into Discord's 3 s acknowledgement window; ack first.
+        await inter.response.defer()
 
         async with self._status_lock:
             uptime_seconds = HealthState.uptime()
             shard_total = self.bot.shard_count or max(1, len(getattr(self.bot, "shards", {})) or 1)
             best_latency, avg_latency, p95_latency, shard_latencies, loop_lag_ms = self._latency_snapshot()
 
-            guild_count = len(self.bot.guilds)
-            text_channels = sum(len(g.text_channels) for g in self.bot.guilds)
-            voice_channels = sum(len(g.voice_channels) for g in self.bot.guilds)
-            member_count = sum(g.member_count or 0 for g in self.bot.guilds)
+            guild_count = text_channels = voice_channels = member_count = 0
+            for guild in self.bot.guilds:
+                guild_count += 1
+                # guild.text_channels/voice_channels each filter and sort; walk the channels once.
+                for channel in guild.channels:
+                    if isinstance(channel, discord.TextChannel):
+                        text_channels += 1
+                    elif isinstance(channel, discord.VoiceChannel):
+                        voice_channels += 1
+                member_count += guild.member_count or 0
 
             players, active_players, queued_tracks = self._lavalink_metrics()
+            nodes = self._lavalink_nodes()
             voice_connections = len(self.bot.voice_clients)
 
             cpu_percent, memory_mb = self._process_metrics()
 
             # Backend/service probes
-            playlist_service = getattr(self.bot, "playlist_service", None)
-            autoplay_service = getattr(self.bot, "autoplay_service", None)
             backends: list[str] = []
-            backend_tasks = []
-            if playlist_service and hasattr(playlist_service, "ping"):
-                backend_tasks.append(asyncio.create_task(self._timed_ping("Playlist (Redis)", playlist_service.ping())))
-            if autoplay_service and hasattr(autoplay_service, "ping"):
-                backend_tasks.append(asyncio.create_task(self._timed_ping("Autoplay (Redis)", autoplay_service.ping())))
-            if backend_tasks:
-                done, pending = await asyncio.wait(backend_tasks, timeout=0.75)
-                for task in pending:
-                    task.cancel()
-                for task in done:
-                    try:
-                        label, duration, ok = task.result()
-                    except Exception:
-                        continue
-                    if ok and duration is not None:
-                        backends.append(f"✅ {label} `{duration:.1f} ms`")
-                    else:
-                        backends.append(f"⚠️ {label} timeout/failed")
-
-            embed = factory.primary("📊 VectoBeat Diagnostics")
-            embed.set_footer(text=f"VectoBeat v{VERSION} | {self.bot.user.name if self.bot.user else 'Bot'}")
-            embed.description = "Comprehensive runtime metrics for monitoring and support."
-
-            shard_lines = [f"`#{sid}` {lat:.1f} ms" for sid, lat in shard_latencies] or ["`#1` n/a"]
-            embed.add_field(
-                name="Latency",
-                value=f"`best {best_latency:.1f} • avg {avg_latency:.1f} • p95 {p95_latency:.1f} ms`\n"
-                + "\n".join(shard_lines),
-                inline=False,
-            )
+            for label, duration, ok in await self._probe_backends():
+                if ok and duration is not None:
+                    backends.append(f"✅ {label} `{duration:.1f} ms`")
+                else:
+                    backends.append(f"⚠️ {label} timeout/failed")
 
-            embed.add_field(
-                name="Uptime",
-                value=f"`{self._format_duration(uptime_seconds)}`",
-                inline=True,
-            )
-            embed.add_field(
-                name="Voice Connections",
-                value=f"`{voice_connections}` active",
-                inline=True,
-            )
-            embed.add_field(
-                name="Shard Allocation",
-                value=f"`{shard_total}` shard(s) • current `{inter.guild.shard_id + 1 if inter.guild else 'N/A'}`",
-                inline=True,
-            )
+        embed = factory.primary("📊 VectoBeat Diagnostics")
+        embed.set_footer(text=_footer_text(self.bot.user.name if self.bot.user else "Bot"))
+        embed.description = "Comprehensive runtime metrics for monitoring and support."
 
-            embed.add_field(
-                name="Guild Footprint",
-                value="\n".join(
-                    [
-                        f"`{self._format_number(guild_count)}` guilds",
-                        f"`{self._format_number(member_count)}` members",
-                        (
-                            f"`{self._format_number(text_channels)}` text / "
-                            f"`{self._format_number(voice_channels)}` voice channels"
-                        ),
-                    ]
-                ),
-                inline=False,
-            )
+        shard_lines = [f"`#{sid}` {lat:.1f} ms" for sid, lat in shard_latencies] or ["`#1` n/a"]
+        embed.add_field(
+            name="Latency",
+            value=f"`best {best_latency:.1f} • avg {avg_latency:.1f} • p95 {p95_latency:.1f} ms`\n"
+            + "\n".join(shard_lines),
+            inline=False,
+        )
 
-            embed.add_field(
-                name="Lavalink",
-                value=(
-                    f"`{players}` players ({active_players} active)\n"
-                    f"`{queued_tracks}` queued tracks"
-                ),
-                inline=True,
-            )
-            nodes = self._lavalink_nodes()
-            if nodes:
-                node_lines = []
-                for node in nodes:
-                    cpu_sys = node.get("cpu_system") or 0.0
-                    cpu_ll = node.get("cpu_lavalink") or 0.0
-                    mem_used = node.get("memory_used")
-                    mem_alloc = node.get("memory_allocated")
-                    playing = node.get("playing") or 0
-                    players_count = node.get("players") or 0
-                    node_lines.append(
-                        f"{node['name']} (`{node['region']}`) — players {playing}/{players_count} | "
-                        f"CPU {cpu_ll*100:.1f}% LL / {cpu_sys*100:.1f}% SYS | "
-                        f"Mem {self._format_bytes(mem_used)} / {self._format_bytes(mem_alloc)}"
-                    )
-                embed.add_field(name="Lavalink Nodes", value="\n".join(node_lines), inline=False)
-
-            runtime_info = "\n".join(
+        embed.add_field(
+            name="Uptime",
+            value=f"`{self._format_duration(uptime_seconds)}`",
+            inline=True,
+        )
+        embed.add_field(
+            name="Voice Connections",
+            value=f"`{voice_connections}` active",
+            inline=True,
+        )
+        embed.add_field(
+            name="Shard Allocation",
+            value=f"`{shard_total}` shard(s) • current `{inter.guild.shard_id + 1 if inter.guild else 'N/A'}`",
+            inline=True,
+        )
+
+        embed.add_field(
+            name="Guild Footprint",
+            value="\n".join(
                 [
-                    f"Python `{platform.python_version()}`",
-                    f"discord.py `{discord.__version__}`",
-                    f"Host `{platform.system()} {platform.release()}`",
+                    f"`{self._format_number(guild_count)}` guilds",
+                    f"`{self._format_number(member_count)}` members",
+                    (
+                        f"`{self._format_number(text_channels)}` text / "
+                        f"`{self._format_number(voice_channels)}` voice channels"
+                    ),
                 ]
-            )
-            embed.add_field(name="Runtime", value=runtime_info, inline=True)
+            ),
+            inline=False,
+        )
 
-            process_lines = []
-            if cpu_percent is not None:
-                process_lines.append(f"CPU `{cpu_percent:.1f}%`")
-            if memory_mb is not None:
-                process_lines.append(f"RAM `{memory_mb:.1f} MB`")
-            if process_lines:
-                embed.add_field(name="Process", value="\n".join(process_lines), inline=True)
-            if loop_lag_ms is not None:
-                embed.add_field(name="Loop Lag", value=f"`{loop_lag_ms:.1f} ms`", inline=True)
+        embed.add_field(
+            name="Lavalink",
+            value=(
+                f"`{players}` players ({active_players} active)\n"
+                f"`{queued_tracks}` queued tracks"
+            ),
+            inline=True,
+        )
+        if nodes:
+            node_lines = []
+            for node in nodes:
+                cpu_sys = node.get("cpu_system") or 0.0
+                cpu_ll = node.get("cpu_lavalink") or 0.0
+                mem_used = node.get("memory_used")
+                mem_alloc = node.get("memory_allocated")
+                playing = node.get("playing") or 0
+                players_count = node.get("players") or 0
+                node_lines.append(
+                    f"{node['name']} (`{node['region']}`) — players {playing}/{players_count} | "
+                    f"CPU {cpu_ll*100:.1f}% LL / {cpu_sys*100:.1f}% SYS | "
+                    f"Mem {self._format_bytes(mem_used)} / {self._format_bytes(mem_alloc)}"
+                )
+            embed.add_field(name="Lavalink Nodes", value="\n".join(node_lines), inline=False)
 
-            if backends:
-                embed.add_field(name="Backends", value="\n".join(backends), inline=False)
+        embed.add_field(name="Runtime", value=_RUNTIME_INFO, inline=True)
 
-            await inter.response.send_message(embed=embed)
+        process_lines = []
+        if cpu_percent is not None:
+            process_lines.append(f"CPU `{cpu_percent:.1f}%`")
+        if memory_mb is not None:
+            process_lines.append(f"RAM `{memory_mb:.1f} MB`")
+        if process_lines:
+            embed.add_field(name="Process", value="\n".join(process_lines), inline=True)
+        if loop_lag_ms is not None:
+            embed.add_field(name="Loop Lag", value=f"`{loop_lag_ms:.1f} ms`", inline=True)
+
+        if backends:
+            embed.add_field(name="Backends", value="\n".join(backends), inline=False)
+
+        await inter.followup.send(embed=embed)
 
     @app_commands.command(name="uptime", description="Show bot uptime with start timestamp.")
     async def uptime(self, inter: discord.Interaction) -> None:
         """Display bot uptime along with the start timestamp."""
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
         uptime_seconds = HealthState.uptime()
-        started_at = datetime.datetime.fromtimestamp(
-            HealthState.started_at, tz=datetime.timezone.utc
-        )
+        started_full, started_relative = _timestamp_labels(HealthState.started_at)
         uptime_hms = self._format_duration(uptime_seconds)
         uptime_days = f"{uptime_seconds/86400:.2f} days"
         embed = factory.primary("⏱️ Uptime")
         embed.description = "Bot uptime and start time."
         embed.add_field(name="Uptime", value=f"`{uptime_hms}`\n`{uptime_days}`", inline=False)
-        embed.add_field(name="Started", value=self._format_datetime(started_at), inline=False)
+        embed.add_field(name="Started", value=f"{started_full} ({started_relative})", inline=False)
         embed.add_field(
             name="Uptime %",
             value=f"`{HealthState.uptime_percent():.2f}%` since first start",
@@ -443,33 +721,40 @@ class InfoCommands(commands.Cog):
     @app_commands.command(name="botinfo", description="Comprehensive information about the running bot.")
     async def botinfo(self, inter: discord.Interaction) -> None:
         """Present application metadata, reach and runtime environment information."""
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
-        app_info = await self.bot.application_info()
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
+        await inter.response.defer()
+        app_info = await self._app_info()
         owner_label = self._format_owner(app_info)
-        guild_count = len(self.bot.guilds)
-        total_members = sum(g.member_count or 0 for g in self.bot.guilds)
+        guild_count = total_members = 0
+        for guild in self.bot.guilds:
+            guild_count += 1
+            total_members += guild.member_count or 0
+        population = getattr(self.bot, "user_population", None)
         if inter.guild:
-            unique_users = len({member.id for member in inter.guild.members})
+            unique_users = len(inter.guild.members)
+        elif population is not None:
+            if not population.ready:
+                # One traversal reseeds the shared counter; later calls stay O(1) until it goes stale.
+                population.seed(self.bot.guilds)
+            unique_users = population.count
         else:
-            seen_users: set[int] = set()
-            for guild in self.bot.guilds:
-                seen_users.update(member.id for member in guild.members)
-            unique_users = len(seen_users)
+            unique_users = len({member.id for guild in self.bot.guilds for member in guild.members})
         cpu_percent, memory_mb = self._process_metrics()
         shard_total = self.bot.shard_count or max(1, len(getattr(self.bot, "shards", {})) or 1)
-        shard_latencies = [(sid, round(lat * 1000, 2)) for sid, lat in getattr(self.bot, "latencies", [])]
-        latency_values = [lat for _, lat in shard_latencies] or [round(self.bot.latency * 1000, 2)]
-        gateway_avg = statistics.mean(latency_values)
+        latency_values = [round(lat * 1000, 2) for _, lat in getattr(self.bot, "latencies", [])] or [
+            round(self.bot.latency * 1000, 2)
+        ]
+        gateway_avg = sum(latency_values) / len(latency_values)
         gateway_best = min(latency_values)
         uptime_seconds = HealthState.uptime()
         lifetime_percent = HealthState.uptime_percent()
-        first_seen = datetime.datetime.fromtimestamp(HealthState.first_seen, tz=datetime.timezone.utc)
+        first_seen_relative = _timestamp_labels(HealthState.first_seen)[1]
 
         embed = factory.primary("🤖 Bot Information")
         embed.add_field(name="Application", value=f"`{app_info.name}`", inline=True)
         if owner_label:
             embed.add_field(name="Owner", value=owner_label, inline=True)
-        embed.add_field(name="Command Count", value=f"`{len(self.bot.tree.get_commands())}`", inline=True)
+        embed.add_field(name="Command Count", value=f"`{self._command_count()}`", inline=True)
         reach_lines = [
             f"`{self._format_number(guild_count)}` guilds",
             f"`{self._format_number(total_members)}` total members",
@@ -489,19 +774,12 @@ class InfoCommands(commands.Cog):
             value="\n".join(
                 [
                     f"`{self._format_duration(uptime_seconds)}` current",
-                    f"`{lifetime_percent:.2f}%` since {discord.utils.format_dt(first_seen, style='R')}",
+                    f"`{lifetime_percent:.2f}%` since {first_seen_relative}",
                 ]
             ),
             inline=True,
         )
-        runtime_meta = "\n".join(
-            [
-                f"Python `{platform.python_version()}`",
-                f"discord.py `{discord.__version__}`",
-                f"Host `{platform.system()} {platform.release()}`",
-            ]
-        )
-        embed.add_field(name="Runtime", value=runtime_meta, inline=True)
+        embed.add_field(name="Runtime", value=_RUNTIME_INFO, inline=True)
         if cpu_percent is not None or memory_mb is not None:
             process_lines = []
             if cpu_percent is not None:
@@ -520,7 +798,7 @@ class InfoCommands(commands.Cog):
         )
         view.add_item(discord.ui.Button(style=discord.ButtonStyle.link, url=website_url, label="Website"))
         view.add_item(discord.ui.Button(style=discord.ButtonStyle.link, url=invite_url, label="Invite Bot"))
-        await inter.response.send_message(embed=embed, view=view)
+        await inter.followup.send(embed=embed, view=view)
 
     @app_commands.command(name="guildinfo", description="Detailed information about this guild.")
     @app_commands.checks.has_permissions(manage_guild=True)
@@ -531,7 +809,7 @@ class InfoCommands(commands.Cog):
             return
 
         guild = inter.guild
-        factory = EmbedFactory(guild.id)
+        factory = get_embed_factory(guild.id)
         embed = factory.primary(f"🏠 Guild Information — {guild.name}")
         embed.description = self._format_datetime(guild.created_at)
 
@@ -542,7 +820,7 @@ class InfoCommands(commands.Cog):
         total_members = guild.member_count or len(guild.members) or 0
         embed.add_field(name="Members", value=f"`{total_members}`", inline=True)
 
-        bot_count = sum(1 for member in guild.members if getattr(member, "bot", False)) if guild.members else 0
+        bot_count = self._bot_count(guild)
         human_count = max(total_members - bot_count, 0)
         embed.add_field(name="Humans / Bots", value=f"`{human_count}` / `{bot_count}`", inline=True)
 
@@ -555,8 +833,9 @@ class InfoCommands(commands.Cog):
             ),
             inline=True,
         )
-        sorted_roles = sorted(guild.roles, key=lambda role: role.position, reverse=True)
-        top_roles = [role.mention for role in sorted_roles if role != guild.default_role][:5]
+        # Six candidates so the top five survive dropping @everyone.
+        top_candidates = heapq.nlargest(6, guild.roles, key=_ROLE_POSITION)
+        top_roles = [role.mention for role in top_candidates if role != guild.default_role][:5]
         top_roles_display = ", ".join(top_roles) if top_roles else "None"
         embed.add_field(
             name="Roles",
@@ -611,26 +890,7 @@ class InfoCommands(commands.Cog):
             inline=True,
         )
 
-        feature_labels = {
-            "ANIMATED_BANNER": "Animated Banner",
-            "ANIMATED_ICON": "Animated Icon",
-            "BANNER": "Banner",
-            "COMMUNITY": "Community",
-            "DISCOVERABLE": "Discoverable",
-            "FEATURES_HUB": "Features Hub",
-            "INVITE_SPLASH": "Invite Splash",
-            "MEMBER_VERIFICATION_GATE_ENABLED": "Membership Screening",
-            "NEWS": "News Channels",
-            "PARTNERED": "Partnered",
-            "PREVIEW_ENABLED": "Preview",
-            "PRIVATE_THREADS": "Private Threads",
-            "ROLE_ICONS": "Role Icons",
-            "TICKETED_EVENTS_ENABLED": "Ticketed Events",
-            "VANITY_URL": "Vanity URL",
-            "VERIFIED": "Verified",
-            "VIP_REGIONS": "VIP Regions",
-        }
-        features = ", ".join(feature_labels.get(feat, feat.replace("_", " ").title()) for feat in sorted(guild.features)) or "_None_"
+        features = ", ".join(_feature_label(feat) for feat in sorted(guild.features)) or "_None_"
         embed.add_field(name="Features", value=features, inline=False)
 
         if guild.icon:
@@ -652,62 +912,51 @@ class InfoCommands(commands.Cog):
     @app_commands.command(name="lavalink", description="Inspect Lavalink node performance.")
     async def lavalink(self, inter: discord.Interaction) -> None:
         """Display per-node Lavalink metrics such as CPU and memory usage."""
-        factory = EmbedFactory(inter.guild.id if inter.guild else None)
-        nodes = self._lavalink_nodes()
+        factory = get_embed_factory(inter.guild.id if inter.guild else None)
+        # /lavalink is a read-only dashboard, so concurrent viewers can share a slightly older poll.
+        nodes = self._lavalink_nodes(max_age=_LAVALINK_VIEW_TTL)
         if not nodes:
             warning_embed = factory.warning("Lavalink is not connected.")
             await inter.response.send_message(embed=warning_embed, ephemeral=True)
             return
 
+        # Ack before formatting; the warning above stays an ephemeral direct reply.
+        await inter.response.defer(thinking=True)
         embed = factory.primary("🎛️ Lavalink Nodes")
+        format_bytes, bool_icon = self._format_bytes, self._bool_icon
         for node in nodes:
-            cpu_ll = node.get("cpu_lavalink")
-            cpu_sys = node.get("cpu_system")
-            cpu_line = (
-                f"CPU `{cpu_ll * 100:.1f}%` LL / `{cpu_sys * 100:.1f}%` SYS"
-                if cpu_ll is not None and cpu_sys is not None
-                else f"CPU `{cpu_ll * 100:.1f}%` LL" if cpu_ll is not None else "CPU `n/a`"
-            )
-            if cpu_sys is not None and cpu_ll is None:
-                cpu_line = f"CPU `{cpu_sys * 100:.1f}%` SYS"
-            if node.get("cpu_cores") is not None:
-                cpu_line += f" • cores `{node['cpu_cores']}`"
-            memory_line = (
-                f"Memory used `{self._format_bytes(node['memory_used'])}` / "
-                f"`{self._format_bytes(node['memory_allocated'])}`"
-            )
-            mem_free = node.get("memory_free")
-            mem_res = node.get("memory_reservable")
-            if mem_free is not None or mem_res is not None:
-                memory_line += f"\nFree `{self._format_bytes(mem_free)}` • Reservable `{self._format_bytes(mem_res)}`"
-
-            uptime_line = ""
-            if node.get("uptime_ms") is not None:
-                uptime_line = f"Uptime `{self._format_duration(node['uptime_ms'] / 1000)}`"
-
-            endpoint_line = f"Endpoint `||{node['endpoint']}||` (SSL {self._bool_icon(bool(node['ssl']))})"
+            get = node.get
+            cpu_ll, cpu_sys, cpu_cores = get("cpu_lavalink"), get("cpu_system"), get("cpu_cores")
+            mem_free, mem_res, uptime_ms = get("memory_free"), get("memory_reservable"), get("uptime_ms")
+            frames, penalties = get("frames"), get("penalties")
+
+            cpu_loads = []
+            if cpu_ll is not None:
+                cpu_loads.append(f"`{cpu_ll * 100:.1f}%` LL")
+            if cpu_sys is not None:
+                cpu_loads.append(f"`{cpu_sys * 100:.1f}%` SYS")
+            cpu_parts = ["CPU " + (" / ".join(cpu_loads) if cpu_loads else "`n/a`")]
+            if cpu_cores is not None:
+                cpu_parts.append(f"cores `{cpu_cores}`")
 
             lines = [
                 f"Region `{node['region']}`",
-                endpoint_line,
+                f"Endpoint `||{node['endpoint']}||` (SSL {bool_icon(bool(node['ssl']))})",
                 f"Players `{node['playing']}/{node['players']}`",
-                cpu_line,
-                memory_line,
+                " • ".join(cpu_parts),
+                f"Memory used `{format_bytes(node['memory_used'])}` / `{format_bytes(node['memory_allocated'])}`",
             ]
-            if uptime_line:
-                lines.append(uptime_line)
-
-            if node["frames"] is not None:
-                frame_line = (
-                    f"Frames sent `{node['frames']}`, deficit `{node['deficit']}`, "
-                    f"nulled `{node['nulled']}`"
-                )
-                lines.append(frame_line)
-            if node.get("penalties") is not None:
-                lines.append(f"Penalties `{node['penalties']}`")
+            if mem_free is not None or mem_res is not None:
+                lines.append(f"Free `{format_bytes(mem_free)}` • Reservable `{format_bytes(mem_res)}`")
+            if uptime_ms is not None:
+                lines.append(f"Uptime `{self._format_duration(uptime_ms / 1000)}`")
+            if frames is not None:
+                lines.append(f"Frames sent `{frames}`, deficit `{node['deficit']}`, nulled `{node['nulled']}`")
+            if penalties is not None:
+                lines.append(f"Penalties `{penalties}`")
             embed.add_field(name=node["name"], value="\n".join(lines), inline=False)
 
-        await inter.response.send_message(embed=embed)
+        await inter.followup.send(embed=embed)
 
     @app_commands.command(name="permissions", description="Show the bot's permissions in this channel.")
     async def permissions(self, inter: discord.Interaction) -> None:
@@ -718,74 +967,39 @@ class InfoCommands(commands.Cog):
             return
 
         guild = inter.guild
-        me = guild.me or guild.get_member(self.bot.user.id)  # type: ignore
+        me = guild.me
+        if me is None and self.bot.user:
+            me = guild.get_member(self.bot.user.id)
         if not me:
             await inter.response.send_message("Unable to identify myself in this guild.", ephemeral=True)
             return
 
         perms = inter.channel.permissions_for(me)
-        factory = EmbedFactory(guild.id)
+        factory = get_embed_factory(guild.id)
         embed = factory.primary(f"🔐 Permissions — {inter.channel.name}")
 
-        recommended = {
-            "view_channel": "View Channel",
-            "send_messages": "Send Messages",
-            "embed_links": "Embed Links",
-            "attach_files": "Attach Files",
-            "add_reactions": "Add Reactions",
-            "use_external_emojis": "Use External Emojis",
-            "read_message_history": "Read Message History",
-            "use_slash_commands": "Use Application Commands",
-        }
-        voice = {
-            "connect": "Connect",
-            "speak": "Speak",
-            "use_voice_activation": "Use Voice Activity",
-            "stream": "Video/Stream",
-            "priority_speaker": "Priority Speaker",
-        }
-        moderation = {
-            "manage_messages": "Manage Messages",
-            "move_members": "Move Members",
-            "mute_members": "Mute Members",
-            "deafen_members": "Deafen Members",
-        }
-
-        def render(section: dict[str, str]) -> list[str]:
-            return [f"{self._bool_icon(getattr(perms, key, False))} {label}" for key, label in section.items()]
-
-        missing = [label for key, label in recommended.items() if not getattr(perms, key, False)]
-
-        embed.add_field(name="Channel", value="\n".join(render(recommended)), inline=False)
-        embed.add_field(name="Voice", value="\n".join(render(voice)), inline=True)
-        embed.add_field(name="Moderation", value="\n".join(render(moderation)), inline=True)
-
-        guild_perms = guild.me.guild_permissions  # type: ignore
-        elevated = []
-        for attr, label in [("administrator", "Administrator"), ("manage_guild", "Manage Guild"), ("manage_roles", "Manage Roles")]:
-            elevated.append(f"{self._bool_icon(getattr(guild_perms, attr, False))} {label}")
-        embed.add_field(name="Guild Level", value="\n".join(elevated), inline=False)
-
+        channel_lines: list[str] = []
+        missing: list[str] = []
+        icon = self._bool_icon
+        for key, label in _RECOMMENDED_PERMS:
+            has = getattr(perms, key, False)
+            channel_lines.append(f"{icon(has)} {label}")
+            if not has:
+                missing.append(label)
+
+        guild_perms = me.guild_permissions
+        fields = [
+            ("Channel", "\n".join(channel_lines), False),
+            ("Voice", _render_perms(perms, _VOICE_PERMS, icon), True),
+            ("Moderation", _render_perms(perms, _MODERATION_PERMS, icon), True),
+            ("Guild Level", _render_perms(guild_perms, _ELEVATED_PERMS, icon), False),
+        ]
         if missing:
-            embed.add_field(name="Missing (recommended)", value=", ".join(missing), inline=False)
-        embed.add_field(name="Permission Integer", value=f"`{me.guild_permissions.value}`", inline=True)
-
-        bot_id = self.bot.user.id if self.bot.user else 0
-        invite_url = (
-            f"https://discord.com/api/oauth2/authorize?client_id={bot_id}"
-            "&permissions=36768832&scope=bot%20applications.commands%20identify"
-        )
-        view = discord.ui.View()
-        view.add_item(discord.ui.Button(style=discord.ButtonStyle.link, url=invite_url, label="Invite (recommended)"))
-        view.add_item(
-            discord.ui.Button(
-                style=discord.ButtonStyle.link,
-                url="https://support.discord.com/hc/en-us/articles/206029707-Setting-Up-Permissions-FAQ",
-                label="Permissions FAQ",
-            )
-        )
+            fields.append(("Missing (recommended)", ", ".join(missing), False))
+        fields.append(("Permission Integer", f"`{guild_perms.value}`", True))
+        add_fields(embed, *fields)
 
-        await inter.response.send_message(embed=embed, view=view, ephemeral=True)
+        await inter.response.send_message(embed=embed, view=self._permissions_view(), ephemeral=True)
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -14,6 +14,7 @@ from discord.ext import commands
 
 from src.services.lavalink_service import LavalinkVoiceClient
 from src.services.server_settings_service import QueueCapacity, ServerSettingsService
+from src.utils.discord_cache import interaction_member
 from src.utils.embeds import EmbedFactory
 from src.utils.time import ms_to_clock
 from lavalink.errors import ClientError
@@ -325,7 +326,7 @@ class MusicControls(commands.Cog):
         if await service.is_collaborative(inter.guild.id):
             return None
 
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         if not isinstance(member, discord.Member):
             return "Unable to resolve invoking member."
         if member.guild_permissions.manage_guild or member.guild_permissions.administrator:
@@ -464,7 +465,7 @@ class MusicControls(commands.Cog):
         manager = self._dj_manager()
         if not manager:
             return None
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         if not isinstance(member, discord.Member):
             return "Unable to resolve invoking member."
         if manager.has_access(inter.guild.id, member):
@@ -675,14 +676,16 @@ class MusicControls(commands.Cog):
             await inter.response.send_message("This command can only be used inside a guild.", ephemeral=True)
             return None
 
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         if not member or not member.voice or not member.voice.channel:
             await inter.response.send_message(embed=factory.error("You must be in a voice channel."), ephemeral=True)
             return None
 
         player = self.bot.lavalink.player_manager.get(inter.guild.id)
 
-        me = inter.guild.me or inter.guild.get_member(self.bot.user.id)  # type: ignore[arg-type]
+        me = inter.guild.me
+        if me is None and self.bot.user:
+            me = inter.guild.get_member(self.bot.user.id)
         if inter.guild.voice_client is None:
             channel: discord.VoiceChannel = member.voice.channel  # type: ignore
             if not me:
@@ -10,6 +10,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from src.services.profile_service import GuildProfileManager
+from src.utils.discord_cache import interaction_member
 from src.utils.embeds import EmbedFactory
 
 if TYPE_CHECKING:
@@ -45,7 +46,7 @@ class ProfileCommands(commands.Cog):
         """Verify the invoker has manage_guild permissions."""
         if not inter.guild:
             return MSG_GUILD_ONLY
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         if not isinstance(member, discord.Member):
             return "Unable to resolve invoking member."
         if not member.guild_permissions.manage_guild:
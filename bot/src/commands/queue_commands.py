@@ -13,6 +13,7 @@ from discord.ext import commands
 
 from src.services.playlist_service import PlaylistService, PlaylistStorageError
 from src.services.server_settings_service import QueueCapacity
+from src.utils.discord_cache import interaction_member
 from src.utils.embeds import EmbedFactory
 from src.utils.time import ms_to_clock
 from src.utils.progress import SlashProgress
@@ -221,7 +222,7 @@ class QueueCommands(commands.Cog):
         manager = self._dj_manager()
         if not manager or not manager.has_restrictions(inter.guild.id):
             return None
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         if not isinstance(member, discord.Member):
             return "Unable to resolve invoking member."
         if manager.has_access(inter.guild.id, member):
@@ -468,7 +469,7 @@ class QueueCommands(commands.Cog):
         """Ensure the invoking member can manage the guild."""
         if not inter.guild:
             return "This command can only be used inside a guild."
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         if not isinstance(member, discord.Member):
             return "Unable to resolve invoking member."
         if not member.guild_permissions.manage_guild:
@@ -7,6 +7,7 @@ from discord import app_commands
 from discord.ext import commands
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
+from src.utils.discord_cache import interaction_member
 from src.utils.embeds import EmbedFactory
 
 if TYPE_CHECKING:
@@ -32,7 +33,7 @@ class ScalingCommands(commands.Cog):
     def _ensure_admin(inter: discord.Interaction) -> bool:
         if not inter.guild:
             return False
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         return isinstance(member, discord.Member) and member.guild_permissions.administrator
 
     @scaling.command(name="status", description="Show current scaling metrics and last signal.")
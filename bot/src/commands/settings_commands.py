@@ -6,6 +6,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from src.utils.discord_cache import interaction_member
 from src.utils.embeds import EmbedFactory
 
 if TYPE_CHECKING:
@@ -28,7 +29,7 @@ class SettingsCommands(commands.Cog):
     def _ensure_manage_guild(self, inter: discord.Interaction) -> Optional[str]:
         if not inter.guild:
             return MSG_GUILD_ONLY
-        member = inter.guild.get_member(inter.user.id) if isinstance(inter.user, discord.User) else inter.user
+        member = interaction_member(inter)
         if not isinstance(member, discord.Member):
             return "Unable to resolve invoking member."
         if member.guild_permissions.manage_guild or member.guild_permissions.administrator:
@@ -9,6 +9,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from src.utils.discord_cache import user_label
 from src.utils.embeds import EmbedFactory
 from src.utils.security import SensitiveScope, has_scope, log_sensitive_action
 
@@ -118,7 +119,7 @@ class SuccessPodCommands(commands.Cog):
             contact=contact,
             summary=summary,
             actor_id=inter.user.id if inter.user else None,
-            actor_name=str(inter.user) if inter.user else None,
+            actor_name=user_label(inter.user) if inter.user else None,
         )
         if not result:
             await inter.followup.send(
@@ -251,7 +252,7 @@ class SuccessPodCommands(commands.Cog):
             inter.guild.id if inter.guild else 0,
             request_id,
             actor_id=inter.user.id if inter.user else 0,
-            actor_name=str(inter.user),
+            actor_name=user_label(inter.user),
             note=note,
             assigned_to=assigned_to,
             assigned_contact=assigned_contact,
@@ -304,7 +305,7 @@ class SuccessPodCommands(commands.Cog):
             inter.guild.id if inter.guild else 0,
             request_id,
             actor_id=inter.user.id if inter.user else 0,
-            actor_name=str(inter.user),
+            actor_name=user_label(inter.user),
             scheduled_for=parsed,
             note=note,
             assigned_to=assigned_to,
@@ -343,7 +344,7 @@ class SuccessPodCommands(commands.Cog):
             inter.guild.id if inter.guild else 0,
             request_id,
             actor_id=inter.user.id if inter.user else 0,
-            actor_name=str(inter.user),
+            actor_name=user_label(inter.user),
             note=note,
         )
         factory = EmbedFactory(inter.guild.id if inter.guild else None)
@@ -225,6 +225,9 @@ class LavalinkNodeEvents(commands.Cog):
                 event.__class__.__name__,
             )
             return
+        manager = getattr(self.bot, "lavalink_manager", None)
+        if manager:
+            manager.mark_node_available(node.name)
         logger.info(
             "Lavalink node '%s' ready with %s player(s).",
             node.name,
@@ -243,6 +246,9 @@ class LavalinkNodeEvents(commands.Cog):
                 event.__class__.__name__,
             )
             return
+        manager = getattr(self.bot, "lavalink_manager", None)
+        if manager:
+            manager.mark_node_unavailable(node.name)
         client = getattr(self.bot, "lavalink", None)
         attached_players = 0
         players = []
@@ -5,6 +5,8 @@ import discord
 from discord.ext import commands, tasks
 import logging
 
+from src.utils.embeds import invalidate_embed_factory
+
 log = logging.getLogger(__name__)
 
 
@@ -32,6 +34,9 @@ class LifecycleEvents(commands.Cog):
     async def on_ready(self) -> None:
         log.info("Bot ready – initializing presence system.")
         self._ready.set()
+        population = getattr(self.bot, "user_population", None)
+        if population is not None:
+            population.seed(self.bot.guilds)
 
         if not self.rotate_status.is_running():
             self.rotate_status.start()
@@ -46,6 +51,9 @@ class LifecycleEvents(commands.Cog):
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         log.info("Joined new guild: %s (%s)", guild.name, guild.id)
+        population = getattr(self.bot, "user_population", None)
+        if population is not None and population.ready:
+            population.add_guild(guild)
         current_max_capacity = (self.bot.shard_count or 1) * 5
         current_guilds = len(self.bot.guilds)
         if current_guilds > current_max_capacity:
@@ -62,13 +70,47 @@ class LifecycleEvents(commands.Cog):
                 self._active_tasks.add(task)
                 task.add_done_callback(self._active_tasks.discard)
 
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        # Dispatched once the guild's member cache has been (re)filled, including after chunking.
+        population = getattr(self.bot, "user_population", None)
+        if population is not None:
+            population.mark_stale()
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        invalidate_embed_factory(guild.id)
+        population = getattr(self.bot, "user_population", None)
+        if population is not None and population.ready:
+            population.remove_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        population = getattr(self.bot, "user_population", None)
+        if population is not None and population.ready:
+            population.add(member.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        population = getattr(self.bot, "user_population", None)
+        if population is not None and population.ready:
+            population.remove(member.id)
+
     @commands.Cog.listener()
     async def on_shard_ready(self, shard_id: int) -> None:
         log.info(f"Shard {shard_id} is ready.")
+        monitor = getattr(self.bot, "latency_monitor", None)
+        get_shard = getattr(self.bot, "get_shard", None)
+        shard = get_shard(shard_id) if monitor and get_shard else None
+        if shard is not None:
+            monitor.record_shard(shard_id, shard.latency)
 
     @commands.Cog.listener()
     async def on_shard_disconnect(self, shard_id: int) -> None:
         log.warning(f"Shard {shard_id} disconnected.")
+        monitor = getattr(self.bot, "latency_monitor", None)
+        if monitor:
+            monitor.forget_shard(shard_id)
 
     # -------------------- LOOP --------------------
 
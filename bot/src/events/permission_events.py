@@ -0,0 +1,53 @@
+"""Gateway listeners that keep the shared permission and user-name caches fresh."""
+
+import discord
+from discord.ext import commands
+
+from src.utils.discord_cache import invalidate_user
+from src.utils.perm_cache import permission_cache
+
+
+class PermissionEvents(commands.Cog):
+    """Invalidate cached permission checks when members, roles or channels change."""
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        permission_cache.invalidate_member(after.guild.id, after.id)
+        if before.display_name != after.display_name:
+            invalidate_user(after.id)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User) -> None:
+        invalidate_user(after.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        permission_cache.invalidate_guild(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        permission_cache.invalidate_guild(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        # Members losing a deleted role get no on_member_update.
+        permission_cache.invalidate_guild(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild) -> None:
+        # Ownership transfers grant or revoke implicit administrator.
+        if before.owner_id != after.owner_id:
+            permission_cache.invalidate_guild(after.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        permission_cache.invalidate_channel(after.guild.id, after.id)
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(PermissionEvents(bot))
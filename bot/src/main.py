@@ -48,12 +48,14 @@ from src.services.automation_audit_service import AutomationAuditService
 from src.services.success_pod_service import SuccessPodService
 from src.services.concierge_service import ConciergeService
 from src.services.scale_contact_service import ScaleContactService
+from src.services.sensitive_audit_service import SensitiveAuditSink
 from src.services.regional_routing_service import RegionalRoutingService
 from src.services.federation_service import FederationService
 from src.services.predictive_health_service import PredictiveHealthService
 from src.services.plugin_service import PluginService
 from src.services.bot_list_service import BotListService
 from src.utils.logger import setup_logging
+from src.utils.population import UniqueUserCounter
 from src.utils.embeds import set_branding_resolver
 from src.utils.plan_capabilities import load_plan_capabilities_async
 
@@ -116,6 +118,7 @@ class VectoBeat(commands.AutoShardedBot):
         self.federation_service = FederationService(bot_cast, CONFIG.control_panel_api)
         self.predictive_health = PredictiveHealthService(bot_cast)
         self.command_throttle = CommandThrottleService(self.server_settings)
+        self.sensitive_audit = SensitiveAuditSink()
         self.analytics_export = AnalyticsExportService(self.server_settings, profile_manager=self.profile_manager)
         self.queue_telemetry = QueueTelemetryService(CONFIG.queue_telemetry, self.server_settings)
         self.alerts = AlertService(CONFIG.alerts, self.server_settings, self.queue_telemetry)
@@ -126,9 +129,12 @@ class VectoBeat(commands.AutoShardedBot):
         self.status_api = StatusAPIService(bot_cast, CONFIG.status_api)
         self.queue_sync = QueueSyncService(CONFIG.queue_sync, self.server_settings)
         self.bot_list = BotListService(self, CONFIG.bot_list)
+        self.user_population = UniqueUserCounter()
         self._entrypoint_payloads: List[dict] = []
         self._panel_parity_task: Optional[asyncio.Task] = None
         self._prefix_cache: dict[int, tuple[str, float]] = {}
+        # Bumped whenever a cog is added or removed so command-tree derived caches can expire.
+        self.command_tree_revision = 0
         # Persist uptime on shutdown
         self.add_cleanup_task(HealthState.persist_async)
 
@@ -153,6 +159,15 @@ class VectoBeat(commands.AutoShardedBot):
                         self.logger.debug("Failed to resolve prefix for guild %s: %s", guild.id, exc)
         return commands.when_mentioned_or(*prefixes)(bot, message)
 
+    async def add_cog(self, cog: commands.Cog, /, **kwargs: Any) -> None:
+        await super().add_cog(cog, **kwargs)
+        self.command_tree_revision += 1
+
+    async def remove_cog(self, name: str, /, **kwargs: Any) -> Optional[commands.Cog]:
+        cog = await super().remove_cog(name, **kwargs)
+        self.command_tree_revision += 1
+        return cog
+
     def add_cleanup_task(self, task: Union[Callable[[], Awaitable[None]], Awaitable[None]]) -> None:
         """Register an async callable that should run before the bot shuts down."""
         self._cleanup_tasks.append(task)
@@ -214,6 +229,8 @@ class VectoBeat(commands.AutoShardedBot):
             await self.alerts.close()
         if hasattr(self, "analytics_export"):
             await self.analytics_export.close()
+        if hasattr(self, "sensitive_audit"):
+            await self.sensitive_audit.close()
         if hasattr(self, "queue_sync"):
             await self.queue_sync.close()
         if hasattr(self, "automation_audit"):
@@ -287,6 +304,7 @@ class VectoBeat(commands.AutoShardedBot):
         set_branding_resolver(self.server_settings.branding_snapshot)
         await self.alerts.start()
         await self.analytics_export.start()
+        await self.sensitive_audit.start()
         await self.queue_telemetry.start()
         await self.queue_sync.start()
         await self.status_api.start()
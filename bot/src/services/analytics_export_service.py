@@ -9,7 +9,7 @@ import json
 import os
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
 
 import aiofiles
 from aiofiles import os as aios
@@ -19,7 +19,7 @@ from src.services.server_settings_service import ServerSettingsService
 if TYPE_CHECKING:
     from src.services.profile_service import GuildProfileManager
 
-GROWTH_TIERS = {"growth", "scale", "enterprise"}
+GROWTH_TIERS = frozenset({"growth", "scale", "enterprise"})
 logger = logging.getLogger("VectoBeat.AnalyticsExport")
 
 
@@ -112,25 +112,50 @@ class AnalyticsExportService:
                 # swallow errors; exporters are best-effort
                 continue
 
-    async def export_snapshot(self, guild_id: int, *, include_historic: bool = True) -> Optional[str]:
-        """Return newline-delimited JSON entries for ``guild_id``."""
+    async def can_export(self, guild_id: int) -> bool:
+        """Return True if ``guild_id`` is on a plan that allows compliance exports."""
         tier = await self.settings.tier(guild_id)
-        if tier not in GROWTH_TIERS:
-            return None
+        return tier in GROWTH_TIERS
+
+    async def stream_snapshot(
+        self,
+        guild_id: int,
+        *,
+        include_historic: bool = True,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Yield UTF-8 encoded JSONL chunks for ``guild_id`` without buffering the full export.
+
+        Callers are expected to gate on :meth:`can_export` first.
+        """
         if not include_historic:
             pending = self._buffer.pop(guild_id, [])
-            if not pending:
-                return ""
-            return "\n".join(json.dumps(entry, ensure_ascii=False) for entry in pending)
+            if pending:
+                # Serialising a large buffer is CPU-bound; keep it off the event loop.
+                yield await asyncio.to_thread(self._encode_entries, pending)
+            return
         await self._flush_all()
         path = os.path.join(self.directory, f"{guild_id}.jsonl")
         try:
-            async with aiofiles.open(path, "r", encoding="utf-8") as handle:
-                return await handle.read()
-        except FileNotFoundError:
-            return ""
+            async with aiofiles.open(path, "rb") as handle:
+                while True:
+                    chunk = await handle.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
         except OSError:
-            return ""
+            return
+
+    @staticmethod
+    def _encode_entries(entries: List[Dict[str, Any]]) -> bytes:
+        return "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode("utf-8")
+
+    async def export_snapshot(self, guild_id: int, *, include_historic: bool = True) -> Optional[str]:
+        """Return newline-delimited JSON entries for ``guild_id``."""
+        if not await self.can_export(guild_id):
+            return None
+        chunks = [chunk async for chunk in self.stream_snapshot(guild_id, include_historic=include_historic)]
+        return b"".join(chunks).decode("utf-8")
 
     async def delete_data(self, guild_id: int) -> bool:
         """Permanently delete all compliance/analytics data for ``guild_id`` (GDPR)."""
@@ -10,7 +10,7 @@ import aiohttp
 from src.configs.schema import ControlPanelAPIConfig
 from src.services.server_settings_service import ServerSettingsService
 
-GROWTH_ENABLED_TIERS = {"growth", "scale", "enterprise"}
+GROWTH_ENABLED_TIERS = frozenset({"growth", "scale", "enterprise"})
 
 
 class AutomationAuditService:
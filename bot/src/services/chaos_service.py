@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import secrets
 from typing import Deque, List, Optional, Tuple
@@ -111,5 +112,8 @@ class ChaosService:
         return message
 
     # ------------------------------------------------------------------ helpers
-    def recent_history(self) -> List[ScenarioResult]:
-        return list(self.history)
+    def recent_history(self, limit: Optional[int] = None) -> List[ScenarioResult]:
+        """Return drill results newest-first, optionally capped at ``limit`` entries."""
+        if limit is None:
+            return list(reversed(self.history))
+        return list(itertools.islice(reversed(self.history), limit))
@@ -9,7 +9,7 @@ from typing import Deque, Dict, Hashable, Tuple
 
 from src.services.server_settings_service import ServerSettingsService
 
-GROWTH_TIERS = {"growth", "scale", "enterprise"}
+GROWTH_TIERS = frozenset({"growth", "scale", "enterprise"})
 
 
 class CommandThrottleService:
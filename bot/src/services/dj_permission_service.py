@@ -7,7 +7,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 import aiofiles
 import discord
@@ -31,6 +31,8 @@ class DJPermissionManager:
         self.path = Path(path)
         self.max_audit = max_audit
         self._configs: Dict[str, DJGuildConfig] = {}
+        # guild_id -> frozen DJ role ids; dropped whenever the role list changes.
+        self._role_sets: Dict[int, FrozenSet[int]] = {}
         self._background_tasks = set()
 
     # ------------------------------------------------------------------ persistence
@@ -47,6 +49,7 @@ class DJPermissionManager:
             raw = json.loads(content)
         except (json.JSONDecodeError, OSError):
             raw = {}
+        self._role_sets.clear()
         for guild_id, payload in raw.items():
             roles = [int(role) for role in payload.get("roles", [])]
             audit = payload.get("audit", [])[-self.max_audit:]
@@ -81,39 +84,68 @@ class DJPermissionManager:
     def get_roles(self, guild_id: int) -> List[int]:
         return list(self.config(guild_id).roles)
 
-    async def set_roles(self, guild_id: int, role_ids: List[int]) -> DJGuildConfig:
+    def role_set(self, guild_id: int) -> FrozenSet[int]:
+        """Return the DJ role ids for ``guild_id`` as a cached frozenset."""
+        roles = self._role_sets.get(guild_id)
+        if roles is None:
+            roles = self._role_sets[guild_id] = frozenset(self.config(guild_id).roles)
+        return roles
+
+    async def set_roles(
+        self, guild_id: int, role_ids: List[int], *, actor: Optional[discord.abc.User] = None,
+        action: Optional[str] = None, details: Optional[str] = None,
+    ) -> DJGuildConfig:
+        """Replace the DJ roles; ``actor``/``action`` record an audit entry in the same save."""
         config = self.config(guild_id)
         config.roles = sorted(set(int(rid) for rid in role_ids))
+        self._role_sets.pop(guild_id, None)
+        if action:
+            self._append_audit(config, actor, action, details)
         await self.save()
         return config
 
-    async def add_role(self, guild_id: int, role_id: int) -> DJGuildConfig:
+    async def add_role(
+        self, guild_id: int, role_id: int, *, actor: Optional[discord.abc.User] = None,
+        action: Optional[str] = None, details: Optional[str] = None,
+    ) -> DJGuildConfig:
         config = self.config(guild_id)
-        if role_id not in config.roles:
+        changed = role_id not in config.roles
+        if changed:
             config.roles.append(role_id)
             config.roles.sort()
+            self._role_sets.pop(guild_id, None)
+        if action:
+            self._append_audit(config, actor, action, details)
+        if changed or action:
             await self.save()
         return config
 
-    async def remove_role(self, guild_id: int, role_id: int) -> DJGuildConfig:
+    async def remove_role(
+        self, guild_id: int, role_id: int, *, actor: Optional[discord.abc.User] = None,
+        action: Optional[str] = None, details: Optional[str] = None,
+    ) -> DJGuildConfig:
         config = self.config(guild_id)
-        if role_id in config.roles:
+        changed = role_id in config.roles
+        if changed:
             config.roles.remove(role_id)
+            self._role_sets.pop(guild_id, None)
+        if action:
+            self._append_audit(config, actor, action, details)
+        if changed or action:
             await self.save()
         return config
 
     def has_restrictions(self, guild_id: int) -> bool:
-        return bool(self.config(guild_id).roles)
+        return bool(self.role_set(guild_id))
 
     def has_access(self, guild_id: int, member: discord.Member) -> bool:
         """Return True if ``member`` can manage the queue in ``guild_id``."""
         if member.guild_permissions.manage_guild or member.guild_permissions.administrator:
             return True
-        config = self.config(guild_id)
-        if not config.roles:
+        roles = self.role_set(guild_id)
+        if not roles:
             return True
-        member_role_ids = {role.id for role in getattr(member, "roles", [])}
-        return any(role_id in member_role_ids for role_id in config.roles)
+        return not roles.isdisjoint(role.id for role in getattr(member, "roles", []))
 
     async def record_action(
         self,
@@ -124,20 +156,25 @@ class DJPermissionManager:
         details: Optional[str] = None,
     ) -> None:
         """Record a queue control action for auditing."""
-        config = self.config(guild_id)
-        entry = {
-            "ts": int(datetime.now(timezone.utc).timestamp()),
-            "user_id": getattr(user, "id", 0),
-            "action": action,
-            "details": details or "",
-        }
-        config.audit.append(entry)
-        config.audit = config.audit[-self.max_audit:]
+        self._append_audit(self.config(guild_id), user, action, details)
         # Use asyncio.create_task to save in background to avoid blocking
         task = asyncio.create_task(self.save())
         self._background_tasks.add(task)
         task.add_done_callback(self._background_tasks.discard)
 
+    def _append_audit(
+        self, config: DJGuildConfig, user: Optional[discord.abc.User], action: str, details: Optional[str]
+    ) -> None:
+        config.audit.append(
+            {
+                "ts": int(datetime.now(timezone.utc).timestamp()),
+                "user_id": getattr(user, "id", 0),
+                "action": action,
+                "details": details or "",
+            }
+        )
+        config.audit = config.audit[-self.max_audit:]
+
     def recent_actions(self, guild_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         config = self.config(guild_id)
         return config.audit[-limit:]
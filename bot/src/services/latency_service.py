@@ -49,6 +49,8 @@ class LatencyMonitor:
         self._latest_shards: Dict[int, float] = {}
         self._task: Optional[asyncio.Task[None]] = None
         self._last_updated: float = 0.0
+        # Stats are derived once per sample tick and served to every reader until the next one.
+        self._cached_snapshot: Optional[LatencySnapshot] = None
 
     # ------------------------------------------------------------------ lifecycle
     async def start(self) -> None:
@@ -88,10 +90,12 @@ class LatencyMonitor:
         for shard_id, latency_ms in raw:
             self._latest_shards[shard_id] = latency_ms
             self._latency_samples.append(latency_ms)
+        self._cached_snapshot = None
 
     def _sample_loop_lag(self, drift_seconds: float) -> None:
         lag_ms = max(drift_seconds * 1000, 0.0)
         self._loop_lag_samples.append(lag_ms)
+        self._cached_snapshot = None
 
     def _collect_latencies(self) -> List[Tuple[int, float]]:
         latencies: List[Tuple[int, float]] = []
@@ -109,9 +113,33 @@ class LatencyMonitor:
         return [(0, max(fallback * 1000, 0.0))]
 
     # ------------------------------------------------------------------ public API
+    def shard_latency_ms(self, shard_id: Optional[int]) -> Optional[float]:
+        """Return the last sampled latency for ``shard_id`` in milliseconds."""
+        if shard_id is None:
+            return None
+        return self._latest_shards.get(shard_id)
+
+    def record_shard(self, shard_id: int, latency: Optional[float]) -> None:
+        """Seed ``shard_id``'s latency (seconds) outside the regular sampling cadence."""
+        if latency is None or latency != latency or latency == float("inf"):
+            return
+        self._latest_shards[shard_id] = max(latency * 1000, 0.0)
+        self._cached_snapshot = None
+
+    def forget_shard(self, shard_id: int) -> None:
+        """Drop the cached latency for a shard that went away."""
+        if self._latest_shards.pop(shard_id, None) is not None:
+            self._cached_snapshot = None
+
     def snapshot(self) -> LatencySnapshot:
+        """Return best/avg/p95 stats, recomputed only after new samples arrive."""
+        cached = self._cached_snapshot
+        if cached is not None:
+            return cached
+
         values = list(self._latency_samples)
         shards = dict(self._latest_shards)
+        sampled = bool(values)
 
         if not values:
             # Fallback directly to current gateway latency if sampling hasn't started.
@@ -126,7 +154,7 @@ class LatencyMonitor:
         p95 = sorted_vals[p95_index]
         loop_lag_ms = statistics.mean(self._loop_lag_samples) if self._loop_lag_samples else None
 
-        return LatencySnapshot(
+        snap = LatencySnapshot(
             best=best,
             average=avg,
             p95=p95,
@@ -134,6 +162,9 @@ class LatencyMonitor:
             loop_lag_ms=loop_lag_ms,
             updated_at=self._last_updated or time.time(),
         )
+        if sampled:
+            self._cached_snapshot = snap
+        return snap
 
     @staticmethod
     def _trimmed_mean(values: List[float], *, trim_ratio: float = 0.2) -> float:
@@ -25,6 +25,11 @@ class VectoPlayer(lavalink.DefaultPlayer):
         super().__init__(guild_id, node)
         self.text_channel_id: int | None = None
 
+    def store_many(self, values: dict[str, Any]) -> None:
+        """Store several user-data keys through the public :meth:`store`."""
+        for key, value in values.items():
+            self.store(key, value)
+
 
 class LavalinkVoiceClient(discord.VoiceProtocol):
     """Voice protocol bridging discord.py voice state with Lavalink."""
@@ -121,6 +126,19 @@ class LavalinkManager:
         self._node_handles: dict[str, lavalink.Node] = {}
         self._nodes_by_region: dict[str, list[str]] = defaultdict(list)
         self._node_priority = {cfg.name: idx for idx, cfg in enumerate(self.nodes)}
+        # Names of nodes last reported ready; maintained from node ready/disconnect events.
+        self._available_nodes: set[str] = set()
+
+    @property
+    def available_node_count(self) -> int:
+        """Number of nodes currently believed to be available (event-maintained)."""
+        return len(self._available_nodes)
+
+    def mark_node_available(self, name: str) -> None:
+        self._available_nodes.add(name)
+
+    def mark_node_unavailable(self, name: str) -> None:
+        self._available_nodes.discard(name)
 
     async def connect(self) -> None:
         if not hasattr(self.bot, "lavalink"):
@@ -173,6 +191,7 @@ class LavalinkManager:
                 config.name,
             )
         else:
+            self.mark_node_available(config.name)
             self.logger.info(
                 "Authenticated Lavalink node %s (%s:%s, ssl=%s)",
                 config.name,
@@ -0,0 +1,87 @@
+"""Background sink that batches privileged-action audit records."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from src.utils.security import AuditRecord
+
+
+class SensitiveAuditSink:
+    """Queue audit records and log them in batches off the interaction path."""
+
+    def __init__(self, *, max_batch: int = 64, flush_interval: float = 0.25, max_queue: int = 10_000) -> None:
+        self.max_batch = max(1, max_batch)
+        self.flush_interval = max(0.01, flush_interval)
+        self.logger = logging.getLogger("VectoBeat.Sensitive")
+        self._queue: asyncio.Queue[AuditRecord] = asyncio.Queue(maxsize=max(1, max_queue))
+        self._task: Optional[asyncio.Task[None]] = None
+        # Records pulled off the queue but not yet written; flushed by close() if cancelled.
+        self._pending: List[AuditRecord] = []
+
+    async def start(self) -> None:
+        if self._task:
+            return
+        self._task = asyncio.create_task(self._worker())
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        remaining, self._pending = self._pending, []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            self._write(remaining)
+
+    def put_nowait(self, record: AuditRecord) -> bool:
+        """Enqueue ``record``; returns False (and warns) if the queue is full."""
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.logger.warning(
+                "Audit queue full; dropping scope=%s action=%s guild=%s",
+                record.scope,
+                record.action,
+                record.guild_id,
+            )
+            return False
+        return True
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._pending
+            batch.append(await self._queue.get())
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+            # The write below cannot be interrupted, so close() no longer owns these records.
+            self._pending = []
+            try:
+                self._write(batch)
+            except Exception as exc:  # pragma: no cover - defensive
+                self.logger.error("Failed to write %s audit records: %s", len(batch), exc)
+
+    def _write(self, batch: List[AuditRecord]) -> None:
+        for record in batch:
+            self.logger.info(
+                "[Sensitive] scope=%s action=%s guild=%s user=%s metadata=%s",
+                record.scope,
+                record.action,
+                record.guild_id,
+                record.user_id,
+                record.metadata,
+            )
@@ -14,6 +14,7 @@ import aiofiles
 import aiohttp
 
 from src.configs.schema import ControlPanelAPIConfig
+from src.utils.embeds import invalidate_embed_factory
 from src.utils.plan_capabilities import get_plan_capabilities
 from src.utils.tracks import source_name
 
@@ -129,12 +130,15 @@ class PanelParitySnapshot:
 class ServerSettingsService:
     """Fetch and cache server configuration exposed via the control panel."""
 
+    TIER_CACHE_TTL = 60.0
+
     def __init__(self, config: ControlPanelAPIConfig, default_prefix: str = "!") -> None:
         self.config = config
         self.enabled = bool(config.enabled and config.base_url)
         self.logger = logging.getLogger("VectoBeat.ServerSettings")
         self._session: Optional[aiohttp.ClientSession] = None
         self._cache: Dict[int, tuple[GuildSettingsState, float]] = {}
+        self._tier_cache: Dict[int, tuple[str, float]] = {}
         self._locks: Dict[int, asyncio.Lock] = {}
         self._endpoint = "/api/bot/server-settings"
         self.default_prefix = default_prefix or "!"
@@ -161,12 +165,19 @@ class ServerSettingsService:
             await self._session.close()
             self._session = None
         self._cache.clear()
+        self._tier_cache.clear()
         self._locks.clear()
         self._global_defaults.clear()
 
+    def invalidate_cached_guilds(self) -> None:
+        """Drop every cached guild settings and tier entry, keeping global defaults."""
+        self._cache.clear()
+        self._tier_cache.clear()
+
     async def invalidate_all(self) -> None:
         """Drop all cached guild settings and global defaults."""
-        self._cache.clear()
+        self.invalidate_cached_guilds()
+        invalidate_embed_factory()
         self._global_defaults.clear()
         await self._persist_global_defaults()
 
@@ -230,6 +241,21 @@ class ServerSettingsService:
         tier = state.tier or "free"
         return tier.lower()
 
+    async def tier_cached(self, guild_id: int) -> str:
+        """Return the tier for ``guild_id`` from a longer-lived cache.
+
+        Tiers only change on billing events, which reach the bot through the
+        per-guild reconcile endpoints that call :meth:`invalidate`; configuration
+        reloads clear every entry via :meth:`invalidate_cached_guilds`.
+        """
+        now = time.monotonic()
+        cached = self._tier_cache.get(guild_id)
+        if cached and cached[1] > now:
+            return cached[0]
+        tier = await self.tier(guild_id)
+        self._tier_cache[guild_id] = (tier, time.monotonic() + self.TIER_CACHE_TTL)
+        return tier
+
     async def refresh_global_defaults(self, discord_id: Optional[str], settings: Dict[str, SettingValue]) -> None:
         """Update in-memory defaults pushed from the control panel."""
         self._global_defaults = settings or {}
@@ -439,6 +465,7 @@ class ServerSettingsService:
         state = self._state_from_payload(response)
         ttl = max(5, self.config.cache_ttl_seconds)
         self._cache[guild_id] = (state, time.monotonic() + ttl)
+        invalidate_embed_factory(guild_id)
         await self.verify_settings(guild_id, state.signature)
         return state
 
@@ -473,6 +500,8 @@ class ServerSettingsService:
             return
         if resolved in self._cache:
             self._cache.pop(resolved, None)
+        self._tier_cache.pop(resolved, None)
+        invalidate_embed_factory(resolved)
 
     async def prefix_for_guild(self, guild_id: int) -> str:
         """Return the configured command prefix for ``guild_id``."""
@@ -26,6 +26,8 @@ from src.configs.schema import StatusAPIConfig
 from src.configs.settings import CONFIG
 from src.services.health_service import HealthState
 from src.services.lavalink_service import VectoPlayer
+from src.utils.embeds import invalidate_embed_factory
+from src.utils.security import reset_scope_cache
 
 
 class StatusAPIService:
@@ -774,7 +776,7 @@ class StatusAPIService:
         settings_service = getattr(self.bot, "server_settings", None)
         if settings_service and isinstance(settings, dict):
             try:
-                settings_service.invalidate_all()
+                await settings_service.invalidate_all()
                 await settings_service.refresh_global_defaults(discord_id, settings)
                 await self._reapply_all_server_policies()
             except Exception as exc:  # pragma: no cover - best effort
@@ -822,9 +824,11 @@ class StatusAPIService:
 
     async def _reload_configuration(self) -> None:
         """Invalidate caches/config and reconcile routing without full restart."""
+        reset_scope_cache()
+        invalidate_embed_factory()
         settings_service = getattr(self.bot, "server_settings", None)
         if settings_service:
-            settings_service.invalidate_all()
+            settings_service.invalidate_cached_guilds()
         routing_service = getattr(self.bot, "regional_routing", None)
         if routing_service:
             try:
@@ -1003,6 +1007,7 @@ class StatusAPIService:
         listener_total = 0
         detail_map: Dict[Tuple[int, int], Dict[str, Any]] = {}
 
+        bot_id = getattr(self.bot.user, "id", None)
         for vc in voice_clients:
             channel = getattr(vc, "channel", None)
             if not channel:
@@ -1010,7 +1015,7 @@ class StatusAPIService:
             guild = channel.guild
             members = getattr(channel, "members", []) or []
             listeners = sum(
-                1 for member in members if not getattr(member, "bot", False) and member.id != getattr(self.bot.user, "id", None)
+                1 for member in members if not getattr(member, "bot", False) and member.id != bot_id
             )
             listener_total += listeners
             key = (int(guild.id), int(getattr(channel, "id", 0)))
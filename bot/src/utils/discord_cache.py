@@ -0,0 +1,57 @@
+"""Member resolution and cached string forms of Discord users for commands and audit metadata."""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple, Union
+
+import discord
+
+UserLike = Union[discord.User, discord.Member]
+
+MAX_ENTRIES = 4096
+
+# user_id -> str(user)
+_labels: Dict[int, str] = {}
+# (guild_id, user_id) -> display name (nicknames are per guild)
+_display_names: Dict[Tuple[Optional[int], int], str] = {}
+
+
+def _bounded_set(store: Dict, key, value: str) -> str:
+    if len(store) >= MAX_ENTRIES:
+        store.pop(next(iter(store)))
+    store[key] = value
+    return value
+
+
+def interaction_member(inter: discord.Interaction) -> Optional[discord.Member]:
+    """Return the invoking guild member, using ``inter.user`` directly when it already is one."""
+    user = inter.user
+    if hasattr(user, "guild_permissions"):
+        return user  # type: ignore[return-value]
+    guild = inter.guild
+    return guild.get_member(user.id) if guild else None
+
+
+def user_label(user: UserLike) -> str:
+    """Return ``str(user)`` without re-formatting it on every call."""
+    cached = _labels.get(user.id)
+    if cached is not None:
+        return cached
+    return _bounded_set(_labels, user.id, str(user))
+
+
+def display_name_for(user: UserLike) -> str:
+    """Return the (guild-aware) display name for ``user``."""
+    guild = getattr(user, "guild", None)
+    key = (guild.id if guild else None, user.id)
+    cached = _display_names.get(key)
+    if cached is not None:
+        return cached
+    return _bounded_set(_display_names, key, user.display_name)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Forget cached names for ``user_id`` across all guilds."""
+    _labels.pop(user_id, None)
+    for key in [key for key in _display_names if key[1] == user_id]:
+        _display_names.pop(key, None)
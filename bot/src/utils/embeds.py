@@ -1,16 +1,51 @@
 """Centralised helpers for building branded Discord embeds."""
 
+import time
 import discord
-from typing import Optional, Iterable, Callable, Dict, Any
+from typing import Optional, Iterable, Callable, Dict, Any, Tuple
 from src.configs.settings import CONFIG
 
 _branding_resolver: Optional[Callable[[Optional[int]], Optional[Dict[str, Any]]]] = None
 
+FACTORY_CACHE_TTL = 30.0
+FACTORY_CACHE_MAX = 1024
+# guild_id -> (factory, expires_at)
+_factory_cache: Dict[Optional[int], Tuple["EmbedFactory", float]] = {}
+
 
 def set_branding_resolver(resolver: Callable[[Optional[int]], Optional[Dict[str, Any]]]) -> None:
     """Inject a resolver used to compute guild-specific branding."""
     global _branding_resolver
     _branding_resolver = resolver
+    _factory_cache.clear()
+
+
+def get_embed_factory(guild_id: Optional[int] = None) -> "EmbedFactory":
+    """Return a short-lived cached :class:`EmbedFactory` for ``guild_id``."""
+    now = time.monotonic()
+    cached = _factory_cache.get(guild_id)
+    if cached and cached[1] > now:
+        return cached[0]
+    factory = EmbedFactory(guild_id)
+    if len(_factory_cache) >= FACTORY_CACHE_MAX:
+        _factory_cache.pop(next(iter(_factory_cache)), None)
+    _factory_cache[guild_id] = (factory, now + FACTORY_CACHE_TTL)
+    return factory
+
+
+def invalidate_embed_factory(guild_id: Optional[int] = None) -> None:
+    """Drop the cached factory for ``guild_id`` (or every factory when omitted)."""
+    if guild_id is None:
+        _factory_cache.clear()
+        return
+    _factory_cache.pop(guild_id, None)
+
+
+def add_fields(embed: discord.Embed, *specs: Tuple[Any, Any, bool]) -> discord.Embed:
+    """Append ``(name, value, inline)`` fields to ``embed`` in order."""
+    for name, value, inline in specs:
+        embed.add_field(name=name, value=value, inline=inline)
+    return embed
 
 
 class EmbedFactory:
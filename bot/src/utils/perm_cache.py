@@ -0,0 +1,68 @@
+"""Short-lived cache for per-member permission checks used by slash commands."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+PermissionKey = Tuple[str, int, int, Optional[int]]
+
+
+class PermissionCache:
+    """TTL/LRU cache keyed by ``(kind, guild_id, user_id, channel_id)``.
+
+    Both positive and negative results are stored so repeat callers skip the
+    member lookup and role/overwrite resolution.  Entries are dropped on expiry
+    or when the gateway reports member, role or channel changes.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 4096) -> None:
+        self.ttl = max(1.0, ttl)
+        self.max_entries = max(1, max_entries)
+        # Key -> (value, expires_at)
+        self._store: "OrderedDict[PermissionKey, tuple[Any, float]]" = OrderedDict()
+
+    def get(self, kind: str, guild_id: int, user_id: int, channel_id: Optional[int] = None) -> Any:
+        """Return the cached value or ``None`` when missing/expired."""
+        key = (kind, guild_id, user_id, channel_id)
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._store.pop(key, None)
+            return None
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, kind: str, guild_id: int, user_id: int, channel_id: Optional[int], value: Any) -> None:
+        """Store ``value`` for the given key."""
+        key = (kind, guild_id, user_id, channel_id)
+        self._store[key] = (value, time.monotonic() + self.ttl)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+
+    def invalidate_member(self, guild_id: int, user_id: int) -> None:
+        """Drop every entry for ``user_id`` inside ``guild_id``."""
+        self._drop(lambda key: key[1] == guild_id and key[2] == user_id)
+
+    def invalidate_guild(self, guild_id: int) -> None:
+        """Drop every entry for ``guild_id`` (e.g. after a role change)."""
+        self._drop(lambda key: key[1] == guild_id)
+
+    def invalidate_channel(self, guild_id: int, channel_id: int) -> None:
+        """Drop channel-scoped entries after overwrites change."""
+        self._drop(lambda key: key[1] == guild_id and key[3] == channel_id)
+
+    def clear(self) -> None:
+        """Drop all cached permission results."""
+        self._store.clear()
+
+    def _drop(self, predicate) -> None:
+        for key in [key for key in self._store if predicate(key)]:
+            self._store.pop(key, None)
+
+
+permission_cache = PermissionCache()
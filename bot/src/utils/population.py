@@ -0,0 +1,53 @@
+"""Refcounted unique-user tally maintained from gateway member events."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+
+class UniqueUserCounter:
+    """Track how many guilds each cached user shares with the bot.
+
+    The refcount keeps removals correct when a user leaves one guild but is
+    still present in another, so ``count`` is an O(1) read instead of a set
+    rebuild over every cached member.
+    """
+
+    def __init__(self) -> None:
+        self._refs: Counter[int] = Counter()
+        self.ready = False
+
+    @property
+    def count(self) -> int:
+        return len(self._refs)
+
+    def seed(self, guilds: Iterable) -> None:
+        """Rebuild the tally from the current member cache."""
+        refs: Counter[int] = Counter()
+        for guild in guilds:
+            refs.update(member.id for member in guild.members)
+        self._refs = refs
+        self.ready = True
+
+    def mark_stale(self) -> None:
+        """Require a reseed before the next read, e.g. after a guild's member cache was refilled."""
+        self.ready = False
+
+    def add(self, user_id: int) -> None:
+        self._refs[user_id] += 1
+
+    def remove(self, user_id: int) -> None:
+        remaining = self._refs.get(user_id, 0) - 1
+        if remaining > 0:
+            self._refs[user_id] = remaining
+        else:
+            self._refs.pop(user_id, None)
+
+    def add_guild(self, guild) -> None:
+        for member in guild.members:
+            self.add(member.id)
+
+    def remove_guild(self, guild) -> None:
+        for member in guild.members:
+            self.remove(member.id)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Union
 
 import discord
 from discord.ext import commands
@@ -10,28 +11,67 @@ from discord.ext import commands
 from src.configs.settings import CONFIG
 
 
+@dataclass
+class AuditRecord:
+    """Single privileged action queued for the audit log."""
+
+    scope: str
+    action: str
+    guild_id: Optional[int]
+    user_id: Optional[int]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
 class SensitiveScope:
     SUCCESS_POD = "success_pod"
     CONCIERGE = "concierge"
     COMPLIANCE_EXPORT = "compliance_export"
 
 
-def _scope_ids(scope: str) -> list[int]:
-    mapping = {
-        SensitiveScope.SUCCESS_POD: CONFIG.security.success_pod_staff_ids,
-        SensitiveScope.CONCIERGE: CONFIG.security.concierge_staff_ids,
-        SensitiveScope.COMPLIANCE_EXPORT: CONFIG.security.compliance_export_admin_ids,
-    }
-    return mapping.get(scope, [])
+_SCOPE_BITS: Dict[str, int] = {
+    SensitiveScope.SUCCESS_POD: 1 << 0,
+    SensitiveScope.CONCIERGE: 1 << 1,
+    SensitiveScope.COMPLIANCE_EXPORT: 1 << 2,
+}
+
+# (user_id -> scope mask, mask of scopes with an allow-list); built once from config
+# and dropped by reset_scope_cache() whenever the configuration is reloaded.
+_scope_index: Optional[Tuple[Dict[int, int], int]] = None
+
+
+def _build_scope_index() -> Tuple[Dict[int, int], int]:
+    global _scope_index
+    security = CONFIG.security
+    masks: Dict[int, int] = {}
+    configured = 0
+    for scope, ids in (
+        (SensitiveScope.SUCCESS_POD, security.success_pod_staff_ids),
+        (SensitiveScope.CONCIERGE, security.concierge_staff_ids),
+        (SensitiveScope.COMPLIANCE_EXPORT, security.compliance_export_admin_ids),
+    ):
+        bit = _SCOPE_BITS[scope]
+        if ids:
+            configured |= bit
+        for user_id in ids:
+            masks[user_id] = masks.get(user_id, 0) | bit
+    _scope_index = (masks, configured)
+    return _scope_index
+
+
+def reset_scope_cache() -> None:
+    """Rebuild the allow-list masks on next use; call after reloading configuration."""
+    global _scope_index
+    _scope_index = None
 
 
 def has_scope(user: Optional[Union[discord.abc.User, discord.Member]], scope: str) -> bool:
     """Return True if ``user`` is in the configured allow-list for ``scope``."""
     if user is None:
         return False
-    ids = _scope_ids(scope)
-    if ids:
-        return user.id in ids
+    bit = _SCOPE_BITS.get(scope, 0)
+    masks, configured = _scope_index or _build_scope_index()
+    if configured & bit:
+        return bool(masks.get(user.id, 0) & bit)
     if isinstance(user, discord.Member):
         return user.guild_permissions.administrator
     return False
@@ -46,12 +86,22 @@ def log_sensitive_action(
     user: Optional[discord.abc.User],
     metadata: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """Emit a structured log entry for privileged operations."""
+    """Emit a structured log entry for privileged operations.
+
+    Records are handed to the bot's :class:`SensitiveAuditSink` when available so
+    the write happens off the interaction path; otherwise they are logged inline.
+    """
+    guild_id = getattr(guild, "id", None)
+    user_id = getattr(user, "id", None)
+    sink = getattr(bot, "sensitive_audit", None)
+    if sink:
+        sink.put_nowait(
+            AuditRecord(scope=scope, action=action, guild_id=guild_id, user_id=user_id, metadata=metadata or {})
+        )
+        return
     logger = getattr(bot, "logger", None)
     if not logger:
         return
-    guild_id = getattr(guild, "id", None)
-    user_id = getattr(user, "id", None)
     logger.info(
         "[Sensitive] scope=%s action=%s guild=%s user=%s metadata=%s",
         scope,
@@ -1,3 +1,8 @@
+import functools
+import time
+from datetime import datetime, timezone
+
+
 def ms_to_clock(ms: int) -> str:
     """Convert milliseconds into a human readable duration string."""
     seconds = max(0, int(ms // 1000))
@@ -6,3 +11,13 @@ def ms_to_clock(ms: int) -> str:
     if hours:
         return f"{hours:d}:{minutes:02d}:{secs:02d}"
     return f"{minutes:d}:{secs:02d}"
+
+
+@functools.lru_cache(maxsize=1)
+def _format_utc_second(second: int) -> str:
+    return datetime.fromtimestamp(second, tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+
+
+def utc_file_timestamp() -> str:
+    """Return the current UTC time as ``YYYYmmdd-HHMMSS`` for filenames, formatted once per second."""
+    return _format_utc_second(int(time.time()))
@@ -0,0 +1,17 @@
+"""
+Regression test: the compliance cog registers its command group exactly once.
+"""
+
+import discord
+import pytest
+from discord.ext import commands
+
+from src.commands.compliance_commands import ComplianceCommands
+
+
+@pytest.mark.asyncio
+async def test_compliance_group_registered_once():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    await bot.add_cog(ComplianceCommands(bot))
+    names = sorted(c.qualified_name for c in bot.tree.walk_commands() if c.qualified_name.startswith("compliance"))
+    assert names == ["compliance", "compliance delete", "compliance export", "compliance status"]
@@ -0,0 +1,74 @@
+"""
+Regression tests for the connection cog: command registration, the Lavalink
+node gate on /connect and the per-guild connect locks.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+from discord.ext import commands
+
+pytest.importorskip("lavalink")
+
+from src.commands.connection_commands import ConnectionCommands  # noqa: E402
+
+
+def _connect_interaction(guild_id: int = 1) -> MagicMock:
+    inter = MagicMock()
+    inter.guild.id = guild_id
+    inter.user.voice.channel = MagicMock(spec=discord.VoiceChannel)
+    inter.response.send_message = AsyncMock()
+    return inter
+
+
+@pytest.mark.asyncio
+async def test_connection_commands_registered_once():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    await bot.add_cog(ConnectionCommands(bot))
+    names = sorted(c.qualified_name for c in bot.tree.walk_commands())
+    assert names == ["connect", "disconnect", "voiceinfo"]
+
+
+@pytest.mark.asyncio
+async def test_connect_rejects_when_node_counter_is_zero():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = ConnectionCommands(bot)
+    bot.lavalink = MagicMock()
+    bot.lavalink.player_manager.get.return_value = None
+    bot.lavalink_manager = MagicMock(available_node_count=0, ensure_ready=AsyncMock())
+    inter = _connect_interaction()
+
+    await cog.connect.callback(cog, inter)
+
+    inter.response.send_message.assert_awaited_once()
+    embed = inter.response.send_message.await_args.kwargs["embed"]
+    assert "offline" in embed.description
+    assert not cog._connect_locks
+
+
+@pytest.mark.asyncio
+async def test_connect_lock_is_shared_and_released():
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    cog = ConnectionCommands(bot)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def hold(label: str) -> None:
+        async with cog._connect_lock(1):
+            order.append(label)
+            await release.wait()
+
+    first = asyncio.create_task(hold("a"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(hold("b"))
+    await asyncio.sleep(0)
+    assert order == ["a"]
+    assert cog._connect_locks[1][1] == 2
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert order == ["a", "b"]
+    assert not cog._connect_locks
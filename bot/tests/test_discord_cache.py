@@ -0,0 +1,36 @@
+"""
+Tests for cached user name helpers (src/utils/discord_cache.py).
+"""
+
+from types import SimpleNamespace
+
+from src.utils import discord_cache
+
+
+class _User(SimpleNamespace):
+    def __str__(self) -> str:
+        return self.name
+
+
+def test_names_are_cached_until_invalidated():
+    user = _User(id=42, name="alpha", display_name="Alpha", guild=SimpleNamespace(id=1))
+    assert discord_cache.user_label(user) == "alpha"
+    assert discord_cache.display_name_for(user) == "Alpha"
+
+    user.name, user.display_name = "beta", "Beta"
+    assert discord_cache.user_label(user) == "alpha"
+    assert discord_cache.display_name_for(user) == "Alpha"
+
+    discord_cache.invalidate_user(42)
+    assert discord_cache.user_label(user) == "beta"
+    assert discord_cache.display_name_for(user) == "Beta"
+
+
+def test_interaction_member_prefers_payload_member():
+    member = SimpleNamespace(id=7, guild_permissions=object())
+    guild = SimpleNamespace(get_member=lambda user_id: ("resolved", user_id))
+    assert discord_cache.interaction_member(SimpleNamespace(user=member, guild=guild)) is member
+
+    user = SimpleNamespace(id=8)
+    assert discord_cache.interaction_member(SimpleNamespace(user=user, guild=guild)) == ("resolved", 8)
+    assert discord_cache.interaction_member(SimpleNamespace(user=user, guild=None)) is None
@@ -0,0 +1,41 @@
+"""
+Tests for DJPermissionManager role caching (src/services/dj_permission_service.py).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.dj_permission_service import DJPermissionManager
+
+
+def _member(*role_ids: int) -> SimpleNamespace:
+    perms = SimpleNamespace(manage_guild=False, administrator=False)
+    return SimpleNamespace(guild_permissions=perms, roles=[SimpleNamespace(id=rid) for rid in role_ids])
+
+
+@pytest.mark.asyncio
+async def test_role_set_is_invalidated_on_mutation(tmp_path):
+    manager = DJPermissionManager(tmp_path / "dj.json")
+    assert manager.role_set(1) == frozenset()
+    assert manager.has_access(1, _member())
+
+    await manager.add_role(1, 10)
+    assert manager.role_set(1) == frozenset({10})
+    assert manager.has_access(1, _member(10, 11))
+    assert not manager.has_access(1, _member(11))
+
+    await manager.remove_role(1, 10)
+    assert not manager.has_restrictions(1)
+
+    await manager.set_roles(1, [20, 21])
+    assert manager.role_set(1) == frozenset({20, 21})
+
+
+@pytest.mark.asyncio
+async def test_role_mutation_records_audit_in_same_save(tmp_path):
+    manager = DJPermissionManager(tmp_path / "dj.json")
+    await manager.add_role(1, 10, actor=SimpleNamespace(id=99), action="config:add-role", details="Granted DJ")
+    actions = manager.recent_actions(1)
+    assert [(a["user_id"], a["action"], a["details"]) for a in actions] == [(99, "config:add-role", "Granted DJ")]
+    assert manager.role_set(1) == frozenset({10})
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from src.utils.embeds import EmbedFactory, set_branding_resolver
+import discord
+from src.utils.embeds import EmbedFactory, add_fields, get_embed_factory, invalidate_embed_factory, set_branding_resolver
 
 @pytest.fixture
 def mock_config():
@@ -51,3 +52,20 @@ def test_branding_sanitization(mock_config):
     embed = factory.primary("Title")
     
     assert embed.color.value == 0xFF00FF
+
+def test_get_embed_factory_reuses_instance_until_invalidated(mock_config):
+    resolver = MagicMock(return_value={"accent": "#00FF00"})
+    set_branding_resolver(resolver)
+
+    first = get_embed_factory(321)
+    assert get_embed_factory(321) is first
+    assert resolver.call_count == 1
+
+    invalidate_embed_factory(321)
+    assert get_embed_factory(321) is not first
+    assert resolver.call_count == 2
+
+def test_add_fields_appends_in_order(mock_config):
+    embed = discord.Embed(title="t")
+    add_fields(embed, ("A", 1, True), ("B", "two", False))
+    assert [(f.name, f.value, f.inline) for f in embed.fields] == [("A", "1", True), ("B", "two", False)]
@@ -0,0 +1,30 @@
+"""
+Tests for the gateway latency sampler (src/services/latency_service.py).
+"""
+
+from types import SimpleNamespace
+
+from src.services.latency_service import LatencyMonitor
+
+
+def test_snapshot_is_reused_until_next_sample():
+    bot = SimpleNamespace(latencies=[(0, 0.05), (1, 0.07)], latency=0.06)
+    monitor = LatencyMonitor(bot)
+    monitor._sample_latencies()
+    first = monitor.snapshot()
+    assert monitor.snapshot() is first
+    assert first.best == 50.0
+
+    bot.latencies = [(0, 0.01)]
+    monitor._sample_latencies()
+    second = monitor.snapshot()
+    assert second is not first
+    assert second.best == 10.0
+
+
+def test_unsampled_snapshot_reads_live_latency():
+    bot = SimpleNamespace(latencies=[], latency=0.02)
+    monitor = LatencyMonitor(bot)
+    assert monitor.snapshot().best == 20.0
+    bot.latency = 0.03
+    assert monitor.snapshot().best == 30.0
@@ -0,0 +1,52 @@
+"""
+Tests for the shared permission cache (src/utils/perm_cache.py).
+"""
+
+from unittest.mock import patch
+
+from src.utils.perm_cache import PermissionCache
+
+
+def test_stores_positive_and_negative_results():
+    cache = PermissionCache()
+    cache.set("manage_guild", 1, 10, None, True)
+    cache.set("administrator", 1, 10, None, False)
+    assert cache.get("manage_guild", 1, 10) is True
+    assert cache.get("administrator", 1, 10) is False
+    assert cache.get("manage_guild", 1, 11) is None
+
+
+def test_entries_expire_after_ttl():
+    cache = PermissionCache(ttl=5)
+    with patch("src.utils.perm_cache.time.monotonic", return_value=100.0):
+        cache.set("manage_guild", 1, 10, None, True)
+    with patch("src.utils.perm_cache.time.monotonic", return_value=106.0):
+        assert cache.get("manage_guild", 1, 10) is None
+
+
+def test_evicts_least_recently_used():
+    cache = PermissionCache(max_entries=2)
+    cache.set("manage_guild", 1, 10, None, True)
+    cache.set("manage_guild", 1, 11, None, True)
+    cache.get("manage_guild", 1, 10)
+    cache.set("manage_guild", 1, 12, None, True)
+    assert cache.get("manage_guild", 1, 11) is None
+    assert cache.get("manage_guild", 1, 10) is True
+
+
+def test_invalidation_scopes():
+    cache = PermissionCache()
+    cache.set("manage_guild", 1, 10, None, True)
+    cache.set("voice_summary", 1, 20, 500, ("ok", []))
+    cache.set("manage_guild", 2, 10, None, True)
+
+    cache.invalidate_channel(1, 500)
+    assert cache.get("voice_summary", 1, 20, 500) is None
+    assert cache.get("manage_guild", 1, 10) is True
+
+    cache.invalidate_member(1, 10)
+    assert cache.get("manage_guild", 1, 10) is None
+    assert cache.get("manage_guild", 2, 10) is True
+
+    cache.invalidate_guild(2)
+    assert cache.get("manage_guild", 2, 10) is None
@@ -0,0 +1,51 @@
+"""
+Tests for the refcounted unique-user counter (src/utils/population.py).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.events.lifecycle_events import LifecycleEvents
+from src.utils.population import UniqueUserCounter
+
+
+def _guild(*ids):
+    return SimpleNamespace(members=[SimpleNamespace(id=i) for i in ids])
+
+
+def test_seed_counts_shared_members_once():
+    counter = UniqueUserCounter()
+    assert counter.ready is False
+    counter.seed([_guild(1, 2), _guild(2, 3)])
+    assert counter.ready is True
+    assert counter.count == 3
+
+
+def test_removal_keeps_users_present_elsewhere():
+    counter = UniqueUserCounter()
+    shared = _guild(1, 2)
+    counter.seed([shared, _guild(2, 3)])
+    counter.remove_guild(shared)
+    assert counter.count == 2
+    counter.remove(2)
+    counter.remove(3)
+    assert counter.count == 0
+    counter.add(4)
+    assert counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_late_chunked_guild_forces_reseed():
+    counter = UniqueUserCounter()
+    guild = _guild(1)
+    counter.seed([guild])
+    assert counter.count == 1
+
+    guild.members.extend(SimpleNamespace(id=i) for i in (2, 3))
+    cog = LifecycleEvents(SimpleNamespace(user_population=counter))
+    await cog.on_guild_available(guild)
+    assert counter.ready is False
+
+    counter.seed([guild])
+    assert counter.count == 3
@@ -0,0 +1,40 @@
+"""
+Tests for sensitive scope checks (src/utils/security.py).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.utils import security
+from src.utils.security import SensitiveScope, has_scope
+
+
+def _security(**overrides):
+    values = {"success_pod_staff_ids": [], "concierge_staff_ids": [], "compliance_export_admin_ids": []}
+    values.update(overrides)
+    return SimpleNamespace(security=SimpleNamespace(**values))
+
+
+def test_allow_list_membership_uses_scope_masks():
+    security.reset_scope_cache()
+    with patch("src.utils.security.CONFIG", _security(concierge_staff_ids=[1, 2], compliance_export_admin_ids=[2])):
+        assert has_scope(SimpleNamespace(id=1), SensitiveScope.CONCIERGE)
+        assert not has_scope(SimpleNamespace(id=1), SensitiveScope.COMPLIANCE_EXPORT)
+        assert has_scope(SimpleNamespace(id=2), SensitiveScope.COMPLIANCE_EXPORT)
+        assert not has_scope(SimpleNamespace(id=3), SensitiveScope.CONCIERGE)
+        # No allow-list for success pods and the user is not a guild member.
+        assert not has_scope(SimpleNamespace(id=1), SensitiveScope.SUCCESS_POD)
+    security.reset_scope_cache()
+
+
+def test_masks_rebuild_after_reset():
+    security.reset_scope_cache()
+    config = _security(concierge_staff_ids=[])
+    with patch("src.utils.security.CONFIG", config):
+        assert not has_scope(SimpleNamespace(id=1), SensitiveScope.CONCIERGE)
+        config.security.concierge_staff_ids.append(5)
+        security.reset_scope_cache()
+        # The populated allow-list now applies instead of the admin fallback.
+        assert not has_scope(SimpleNamespace(id=1), SensitiveScope.CONCIERGE)
+        assert has_scope(SimpleNamespace(id=5), SensitiveScope.CONCIERGE)
+    security.reset_scope_cache()
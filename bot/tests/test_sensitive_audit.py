@@ -0,0 +1,39 @@
+"""
+Tests for the batched privileged-action audit sink (src/services/sensitive_audit_service.py).
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.sensitive_audit_service import SensitiveAuditSink
+from src.utils.security import AuditRecord
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_records_held_by_the_worker():
+    sink = SensitiveAuditSink(flush_interval=5.0)
+    written = []
+    sink._write = written.extend  # type: ignore[method-assign]
+    await sink.start()
+    for user_id in range(3):
+        sink.put_nowait(AuditRecord(scope="compliance", action="export", guild_id=1, user_id=user_id))
+
+    async def batched() -> None:
+        while len(sink._pending) < 3:  # yield until the worker holds every record in its batch
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(batched(), timeout=1)
+    await sink.close()
+    assert [record.user_id for record in written] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_records_still_queued():
+    sink = SensitiveAuditSink(flush_interval=5.0)
+    written = []
+    sink._write = written.extend  # type: ignore[method-assign]
+    for user_id in range(3):
+        sink.put_nowait(AuditRecord(scope="compliance", action="export", guild_id=1, user_id=user_id))
+    await sink.close()
+    assert [record.user_id for record in written] == [0, 1, 2]
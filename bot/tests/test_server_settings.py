@@ -117,6 +117,17 @@ class TestInvalidate:
         svc.invalidate("456")
         assert 456 not in svc._cache
 
+    def test_invalidate_cached_guilds_keeps_global_defaults(self, svc):
+        import time
+        state = GuildSettingsState(tier="pro", settings={}, signature=None)
+        svc._cache[1] = (state, time.monotonic() + 300)
+        svc._tier_cache[1] = ("pro", time.monotonic() + 300)
+        svc._global_defaults = {"defaultVolume": 40}
+        svc.invalidate_cached_guilds()
+        assert not svc._cache
+        assert not svc._tier_cache
+        assert svc._global_defaults == {"defaultVolume": 40}
+
 
 # ─── branding_snapshot ───────────────────────────────────────────────────────
 
@@ -167,3 +178,19 @@ class TestStateFromPayload:
     def test_signature_preserved(self, svc):
         state = svc._state_from_payload({"settings": {}, "signature": "sig123"})
         assert state.signature == "sig123"
+
+
+# ─── tier_cached ──────────────────────────────────────────────────────────────
+
+class TestTierCached:
+    @pytest.mark.asyncio
+    async def test_reuses_cached_tier_until_invalidated(self, svc):
+        svc.tier = AsyncMock(return_value="growth")
+        assert await svc.tier_cached(42) == "growth"
+        assert await svc.tier_cached(42) == "growth"
+        assert svc.tier.await_count == 1
+
+        svc.invalidate(42)
+        svc.tier.return_value = "scale"
+        assert await svc.tier_cached(42) == "scale"
+        assert svc.tier.await_count == 2
@@ -5,8 +5,9 @@ Focuses on event recording, auth enforcement, and push configuration.
 
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
+from src.services.server_settings_service import ServerSettingsService
 from src.services.status_api_service import StatusAPIService
-from src.configs.schema import StatusAPIConfig
+from src.configs.schema import ControlPanelAPIConfig, StatusAPIConfig
 
 
 # ─── Fixtures ─────────────────────────────────────────────────────────────────
@@ -131,3 +132,25 @@ class TestPushConfiguration:
 
     def test_usage_endpoint_configured(self, svc):
         assert svc._usage_endpoint == "https://example.com/api/bot/usage"
+
+
+# ─── configuration reload ────────────────────────────────────────────────────
+
+class TestReloadConfiguration:
+    @pytest.mark.asyncio
+    async def test_reload_empties_tier_cache(self, svc):
+        settings = ServerSettingsService(ControlPanelAPIConfig(), default_prefix="!")
+        settings._tier_cache[42] = ("growth", float("inf"))
+        svc.bot.server_settings = settings
+        svc.bot.regional_routing = None
+        svc.bot.search_cache = None
+        await svc._reload_configuration()
+        assert not settings._tier_cache
+
+    @pytest.mark.asyncio
+    async def test_reload_drops_cached_embed_factories(self, svc):
+        from src.utils.embeds import get_embed_factory
+
+        factory = get_embed_factory(7)
+        await svc._reload_configuration()
+        assert get_embed_factory(7) is not factory